@@ -1,78 +1,261 @@
 import os
 import json
-from typing import Dict, Any
+import hashlib
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+MAX_FILE_SIZE = 1024 * 1024  # Contents of larger files are not included
+BINARY_SNIFF_SIZE = 8192
+CACHE_FILE = '.project_analysis_cache.json'
+OUTPUT_FILE = 'project_structure.jsonl'
+
 
 class ProjectAnalyzer:
-    def __init__(self, root_dir: str):
-        self.root_dir = root_dir
+    def __init__(self, root_dir: str, max_file_size: int = MAX_FILE_SIZE,
+                 workers: Optional[int] = None, cache_file: Optional[str] = CACHE_FILE):
+        self.root_dir = os.path.abspath(root_dir)
+        self.max_file_size = max_file_size
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.cache_path = os.path.join(self.root_dir, cache_file) if cache_file else None
         self.ignored_dirs = {'__pycache__', '.git', '.venv', 'venv', 'env', '.ipynb_checkpoints', '.jupyter'}
-        self.ignored_files = {'.pyc', '.pyo', '.pyd', '.so', '.dll', '.html', '.md', '.pdf', 'analyze_project.py', '.gitignore' , '.log', 'hotel_data.json', 'project_structure.json'}
+        # Exact file names and suffixes are kept apart so each check is a
+        # set lookup plus a single endswith call
+        self.ignored_names = {'analyze_project.py', '.gitignore', 'hotel_data.json',
+                              'project_structure.json', OUTPUT_FILE, CACHE_FILE}
+        self.ignored_suffixes = ('.pyc', '.pyo', '.pyd', '.so', '.dll', '.html', '.md', '.pdf', '.log', '.tmp')
+        self.cache: Dict[str, Dict[str, Any]] = {}
 
-    def should_ignore(self, path: str) -> bool:
-        """Check if the path should be ignored."""
-        parts = path.split(os.sep)
-        return any(part in self.ignored_dirs for part in parts) or \
-               any(path.endswith(ext) for ext in self.ignored_files)
+    def should_ignore(self, name: str, is_dir: bool) -> bool:
+        """Check if a directory entry should be ignored."""
+        if is_dir:
+            return name in self.ignored_dirs
+        return name in self.ignored_names or name.endswith(self.ignored_suffixes)
 
-    def read_file_content(self, file_path: str) -> str:
-        """Read and return file content."""
+    def iter_files(self) -> Iterator[Tuple[str, os.stat_result]]:
+        """Walk the tree with os.scandir, yielding (relative path, stat)."""
+        stack = [self.root_dir]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                with os.scandir(dir_path) as entries:
+                    entries = sorted(entries, key=lambda e: e.name)
+            except OSError:
+                continue
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if self.should_ignore(entry.name, is_dir):
+                        continue
+                    if is_dir:
+                        subdirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield os.path.relpath(entry.path, self.root_dir), entry.stat()
+                except OSError:
+                    continue
+            # Reverse so directories are visited in sorted order
+            stack.extend(reversed(subdirs))
+
+    @staticmethod
+    def is_binary(sample: bytes) -> bool:
+        """Treat files with NUL bytes or invalid UTF-8 as binary."""
+        if b'\0' in sample:
+            return True
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        except Exception as e:
-            return f"Error reading file: {str(e)}"
-
-    def analyze_directory(self, dir_path: str) -> Dict[str, Any]:
-        """Recursively analyze directory and return structured data."""
-        structure = {
-            'type': 'directory',
-            'name': os.path.basename(dir_path),
-            'contents': {}
-        }
+            sample.decode('utf-8')
+        except UnicodeDecodeError as e:
+            # A multi-byte character may be cut off at the end of the sample
+            return e.start < len(sample) - 3
+        return False
 
+    def read_file(self, rel_path: str, stat: os.stat_result) -> Dict[str, Any]:
+        """Hash a file and read its content if it is small text."""
+        record: Dict[str, Any] = {
+            'type': 'file',
+            'path': rel_path,
+            'extension': os.path.splitext(rel_path)[1],
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+        }
+        full_path = os.path.join(self.root_dir, rel_path)
+        digest = hashlib.sha256()
         try:
-            items = os.listdir(dir_path)
-            for item in items:
-                full_path = os.path.join(dir_path, item)
-                
-                if self.should_ignore(full_path):
+            with open(full_path, 'rb') as f:
+                head = f.read(BINARY_SNIFF_SIZE)
+                digest.update(head)
+                record['binary'] = self.is_binary(head)
+                if record['binary'] or stat.st_size > self.max_file_size:
+                    # Hash the rest in chunks without keeping it in memory
+                    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                        digest.update(chunk)
+                    record['content'] = None
+                    record['skipped'] = 'binary' if record['binary'] else 'too_large'
+                else:
+                    rest = f.read()
+                    digest.update(rest)
+                    record['content'] = (head + rest).decode('utf-8', errors='replace')
+        except OSError as e:
+            record['error'] = f"Error reading file: {str(e)}"
+            return record
+        record['sha256'] = digest.hexdigest()
+        return record
+
+    def load_cache(self):
+        if self.cache_path and os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    self.cache = json.load(f)
+            except (OSError, ValueError):
+                self.cache = {}
+
+    def save_cache(self, cache: Dict[str, Dict[str, Any]]):
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, self.cache_path)
+
+    @staticmethod
+    def iter_previous(path: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """Stream the file records of an earlier output, in walk order."""
+        if not path or not os.path.exists(path):
+            return
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
                     continue
+                if record.get('type') == 'file':
+                    yield record
+
+    def replay(self, previous: Iterator[Dict[str, Any]], rel_path: str,
+               cached: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Find a file's record in the earlier output, or None.
 
-                if os.path.isfile(full_path):
-                    structure['contents'][item] = {
-                        'type': 'file',
-                        'name': item,
-                        'extension': os.path.splitext(item)[1],
-                        'content': self.read_file_content(full_path)
-                    }
-                elif os.path.isdir(full_path):
-                    structure['contents'][item] = self.analyze_directory(full_path)
+        Both runs walk the tree in the same order, so the earlier output
+        is only ever read forward; records skipped on the way belong to
+        files that changed or were deleted.
+        """
+        for record in previous:
+            if record.get('path') != rel_path:
+                continue
+            if record.get('sha256') != cached.get('sha256') or 'error' in record:
+                return None
+            # Re-read text files whose content would be included differently
+            # under this run's size limit
+            too_large = record.get('size', 0) > self.max_file_size
+            if not record.get('binary') and (record.get('skipped') == 'too_large') != too_large:
+                return None
+            return record
+        return None
 
-        except Exception as e:
-            structure['error'] = str(e)
+    def analyze(self, full: bool = False,
+                previous_output: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield one record per file, reading files in parallel.
 
-        return structure
+        Files whose size and mtime match the cache are not read again when
+        ``previous_output`` holds their record from an earlier run; that
+        record is streamed back with status unchanged, so every run yields
+        a complete snapshot. Other files are read, and those that still
+        hash the same are also reported as unchanged. Pass ``full`` to
+        re-read every file. Cached files that no longer exist are reported
+        as deleted.
+        """
+        self.load_cache()
+        new_cache: Dict[str, Dict[str, Any]] = {}
+        window = self.workers * 4
+        previous = self.iter_previous(None if full else previous_output)
 
-    def analyze(self) -> Dict[str, Any]:
-        """Analyze the entire project and return structured data."""
-        return self.analyze_directory(self.root_dir)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending: deque = deque()
+
+            def drain(limit: int) -> Iterator[Dict[str, Any]]:
+                # Emit results in walk order while bounding in-flight reads
+                while len(pending) > limit:
+                    yield self._finish(pending.popleft(), new_cache)
+
+            for rel_path, stat in self.iter_files():
+                cached = self.cache.get(rel_path)
+                record = None
+                if (not full and cached and cached['size'] == stat.st_size
+                        and cached['mtime_ns'] == stat.st_mtime_ns):
+                    record = self.replay(previous, rel_path, cached)
+                if record is not None:
+                    pending.append(('unchanged', rel_path, stat, (cached, record)))
+                else:
+                    pending.append(('read', rel_path, stat, pool.submit(self.read_file, rel_path, stat)))
+                yield from drain(window)
+            yield from drain(0)
+        previous.close()
+
+        for rel_path in self.cache.keys() - new_cache.keys():
+            yield {'type': 'file', 'path': rel_path, 'status': 'deleted'}
+        self.save_cache(new_cache)
+        self.cache = new_cache
+
+    def _finish(self, item, new_cache: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        kind, rel_path, stat, payload = item
+        if kind == 'unchanged':
+            cached, record = payload
+            new_cache[rel_path] = {'size': cached['size'], 'mtime_ns': cached['mtime_ns'],
+                                   'sha256': cached['sha256']}
+            return dict(record, status='unchanged')
+
+        record = payload.result()
+        cached = self.cache.get(rel_path)
+        if 'sha256' in record:
+            new_cache[rel_path] = {'size': record['size'], 'mtime_ns': record['mtime_ns'],
+                                   'sha256': record['sha256']}
+        if cached is None:
+            record['status'] = 'new'
+        elif cached.get('sha256') == record.get('sha256'):
+            record['status'] = 'unchanged'
+        else:
+            record['status'] = 'modified'
+        return record
+
+    def save_analysis(self, output_file: str, full: bool = False) -> Dict[str, int]:
+        """Stream analysis records to a JSON lines file and return counts.
+
+        The file lists every current file; deleted files are only counted.
+        Records of unchanged files are streamed from the existing output.
+        """
+        counts: Dict[str, int] = {}
+        tmp_path = f"{output_file}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'type': 'root', 'name': os.path.basename(self.root_dir),
+                                'path': self.root_dir}) + '\n')
+            for record in self.analyze(full=full, previous_output=output_file):
+                status = record.get('status', 'error')
+                counts[status] = counts.get(status, 0) + 1
+                if status != 'deleted':
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        os.replace(tmp_path, output_file)
+        return counts
 
-    def save_analysis(self, output_file: str):
-        """Analyze project and save results to a JSON file."""
-        analysis = self.analyze()
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2)
 
 def main():
-    # Get the current directory as the root directory
-    root_dir = os.getcwd()
-    
+    parser = argparse.ArgumentParser(description='Analyze the project tree into JSON lines')
+    parser.add_argument('root', nargs='?', default=os.getcwd(), help='Project root directory')
+    parser.add_argument('--output', default=OUTPUT_FILE)
+    parser.add_argument('--workers', type=int, default=None, help='Parallel file readers')
+    parser.add_argument('--max-size', type=int, default=MAX_FILE_SIZE,
+                        help='Skip contents of files larger than this many bytes')
+    parser.add_argument('--full', action='store_true', help='Re-read every file, ignoring the cache')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the cache')
+    args = parser.parse_args()
+
     # Create analyzer instance
-    analyzer = ProjectAnalyzer(root_dir)
-    
-    # Save analysis to project_structure.json
-    analyzer.save_analysis('project_structure.json')
-    print("Project analysis completed and saved to project_structure.json")
+    analyzer = ProjectAnalyzer(args.root, max_file_size=args.max_size, workers=args.workers,
+                               cache_file=None if args.no_cache else CACHE_FILE)
+
+    counts = analyzer.save_analysis(args.output, full=args.full)
+    summary = ', '.join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"Project analysis completed and saved to {args.output} ({summary or 'no files'})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
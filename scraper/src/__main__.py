@@ -0,0 +1,285 @@
+"""Command-line entry point: ``python -m src <command>``.
+
+Selenium, the scraper and the parsers are imported inside the commands
+that need them, so ``export`` and ``query`` start without loading them.
+"""
+import argparse
+import json
+import sys
+from datetime import datetime
+
+FIELD_CHOICES = ('location', 'reviews', 'price', 'images', 'rooms', 'amenities')
+
+
+def _date(value):
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _fields(value):
+    fields = {f.strip() for f in value.split(',') if f.strip()}
+    unknown = fields - set(FIELD_CHOICES)
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown fields: {', '.join(sorted(unknown))}")
+    return fields
+
+
+def _load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    # Re-extraction output is a list of results; scraper output is one
+    return data if isinstance(data, list) else [data]
+
+
+def _output_name(city, check_in, check_out):
+    slug = ''.join(c if c.isalnum() else '-' for c in city.lower()).strip('-')
+    return f"{slug}_{check_in:%Y-%m-%d}_{check_out:%Y-%m-%d}.json"
+
+
+def _load_state(track):
+    """Load the amenity vocabulary and, when tracking, the price detector"""
+    from src.config.settings import AMENITY_VOCAB_FILE, PRICE_STATE_FILE
+    from src.utils.amenities import AmenityVocabulary
+
+    detector = None
+    if track:
+        from src.tracking.changes import PriceChangeDetector
+        detector = PriceChangeDetector.load(PRICE_STATE_FILE)
+    return AmenityVocabulary.load(AMENITY_VOCAB_FILE), detector
+
+
+def run_job(city, check_in, check_out, limit=None, fields=None, output=None,
+            record=False, track=False, broker=None, shared=None):
+    """Scrape one city/date job and save its results; returns the results.
+
+    ``shared`` is a ``(vocab, detector, lock)`` tuple used by batch runs so
+    concurrent jobs update one vocabulary and one detector, which the
+    caller saves once. Without it the job loads and saves its own state.
+    """
+    from src.scrapers.kayak import KayakHotelScraper
+
+    vocab, detector, lock = shared or (None, None, None)
+    if track and not shared:
+        from src.config.settings import PRICE_STATE_FILE
+        from src.tracking.changes import PriceChangeDetector
+        detector = PriceChangeDetector.load(PRICE_STATE_FILE)
+
+    scraper = KayakHotelScraper(city, check_in, check_out, change_detector=detector,
+                                record=record, fields=fields, broker=broker,
+                                amenity_vocab=vocab, state_lock=lock)
+    try:
+        results = scraper.scrape_hotels(limit=limit)
+        scraper.save_results(output or _output_name(city, check_in, check_out))
+        return results
+    finally:
+        scraper.close()
+
+
+def cmd_scrape(args):
+    results = run_job(args.city, args.check_in, args.check_out, limit=args.limit,
+                      fields=args.fields, output=args.output, record=args.record,
+                      track=args.track)
+    hotels = results.get('hotels', []) if isinstance(results, dict) else []
+    print(f"Scraped {len(hotels)} hotels")
+    for event in results.get('price_events', []) if isinstance(results, dict) else []:
+        print(f"{event['type']}: {event['hotel_name']} {event.get('new_price', '')}")
+    return 0 if hotels else 1
+
+
+def cmd_batch(args):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from src.config.settings import AMENITY_VOCAB_FILE, PRICE_STATE_FILE
+
+    with open(args.jobs, 'r', encoding='utf-8') as f:
+        jobs = json.load(f)
+
+    broker = None
+    if args.workers > 1:
+        from src.config.settings import REMOTE_WEBDRIVER_NODES
+        if REMOTE_WEBDRIVER_NODES:
+            from src.core.broker import SessionBroker
+            broker = SessionBroker()
+
+    vocab, detector = _load_state(args.track)
+    shared = (vocab, detector, threading.Lock())
+
+    def run(job):
+        try:
+            results = run_job(
+                job['city'], _date(job['check_in']), _date(job['check_out']),
+                limit=job.get('limit', args.limit),
+                fields=_fields(job['fields']) if job.get('fields') else args.fields,
+                output=job.get('output'), record=args.record, track=args.track,
+                broker=broker, shared=shared
+            )
+            return job, len(results.get('hotels', [])) if isinstance(results, dict) else 0, None
+        except Exception as e:
+            return job, 0, str(e)
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        for job, count, error in pool.map(run, jobs):
+            label = f"{job['city']} {job['check_in']}..{job['check_out']}"
+            if error:
+                failures += 1
+                print(f"FAILED {label}: {error}")
+            else:
+                print(f"{label}: {count} hotels")
+
+    # Saved once, after every job, so concurrent jobs cannot overwrite
+    # each other's updates
+    vocab.save(AMENITY_VOCAB_FILE)
+    if detector:
+        detector.save(PRICE_STATE_FILE)
+    return 1 if failures else 0
+
+
+def _hotel_rows(results):
+    for result in results:
+        city = result.get('city')
+        for hotel in result.get('hotels', []):
+            scores = hotel.get('review_scores') or {}
+            base = {
+                'city': city,
+                'hotel_name': hotel.get('hotel_name'),
+                'location': hotel.get('location'),
+                'price': hotel.get('price'),
+                'price_amount': hotel.get('price_amount'),
+                'price_currency': hotel.get('price_currency'),
+                'rating': scores.get('rating'),
+                'review_count': scores.get('count'),
+                'amenities': '|'.join(hotel.get('amenity_keys') or []),
+                'detail_url': hotel.get('detail_url'),
+            }
+            rooms = hotel.get('rooms') or [{}]
+            for room in rooms:
+                row = dict(base)
+                row['room_type'] = room.get('room_type')
+                row['room_price'] = room.get('price')
+                row['room_currency'] = room.get('currency')
+                yield row
+
+
+def cmd_export(args):
+    import csv
+
+    rows = _hotel_rows(_load_results(args.input))
+    out = open(args.output, 'w', encoding='utf-8', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'jsonl':
+            for row in rows:
+                out.write(json.dumps(row, ensure_ascii=False) + '\n')
+        else:
+            first = next(rows, None)
+            if first is None:
+                return 0
+            writer = csv.DictWriter(out, fieldnames=list(first))
+            writer.writeheader()
+            writer.writerow(first)
+            writer.writerows(rows)
+    finally:
+        if args.output:
+            out.close()
+    return 0
+
+
+def cmd_query(args):
+    mask = 0
+    if args.amenity:
+        from src.config.settings import AMENITY_VOCAB_FILE
+        from src.utils.amenities import AmenityVocabulary
+        vocab = AmenityVocabulary.load(AMENITY_VOCAB_FILE)
+        try:
+            mask = vocab.mask(*args.amenity)
+        except KeyError as e:
+            print(f"Unknown amenity: {e.args[0]}", file=sys.stderr)
+            return 2
+
+    matches = 0
+    for result in _load_results(args.input):
+        for hotel in result.get('hotels', []):
+            if args.name and args.name.lower() not in (hotel.get('hotel_name') or '').lower():
+                continue
+            if mask and hotel.get('amenity_bitset', 0) & mask != mask:
+                continue
+            price = hotel.get('price_amount')
+            if args.max_price is not None and (price is None or price > args.max_price):
+                continue
+            rating = (hotel.get('review_scores') or {}).get('rating')
+            if args.min_rating is not None and (rating is None or rating < args.min_rating):
+                continue
+            matches += 1
+            currency = hotel.get('price_currency') or ''
+            print(f"{hotel.get('hotel_name')}\t{price if price is not None else '-'} {currency}\t"
+                  f"{rating if rating is not None else '-'}")
+    print(f"{matches} matching hotels", file=sys.stderr)
+    return 0
+
+
+def cmd_reextract(args):
+    from src.scrapers.offline import main as reextract_main
+
+    argv = ['--archive', args.archive, '--output', args.output]
+    if args.workers:
+        argv += ['--workers', str(args.workers)]
+    reextract_main(argv)
+    return 0
+
+
+def build_parser():
+    from src.config.settings import DATA_DIR, SNAPSHOT_DIR
+
+    parser = argparse.ArgumentParser(prog='python -m src', description='Kayak hotel price tracker')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    def add_scrape_options(p):
+        p.add_argument('--limit', type=int, default=None, help='Maximum hotels per search')
+        p.add_argument('--fields', type=_fields, default=None,
+                       help=f"Comma-separated fields ({', '.join(FIELD_CHOICES)})")
+        p.add_argument('--record', action='store_true', help='Archive raw page snapshots')
+        p.add_argument('--track', action='store_true', help='Emit price change events')
+
+    p = sub.add_parser('scrape', help='Scrape one city and date range')
+    p.add_argument('city')
+    p.add_argument('check_in', type=_date, help='YYYY-MM-DD')
+    p.add_argument('check_out', type=_date, help='YYYY-MM-DD')
+    p.add_argument('--output', help='Output file name under data/')
+    add_scrape_options(p)
+    p.set_defaults(func=cmd_scrape)
+
+    p = sub.add_parser('batch', help='Scrape every job in a JSON job file')
+    p.add_argument('jobs', help='JSON list of {"city", "check_in", "check_out"} jobs')
+    p.add_argument('--workers', type=int, default=1,
+                   help='Concurrent jobs (uses REMOTE_WEBDRIVER_NODES when set)')
+    add_scrape_options(p)
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser('export', help='Flatten results to CSV or JSON lines')
+    p.add_argument('input', help='Results JSON file')
+    p.add_argument('--output', help='Output file (default: stdout)')
+    p.add_argument('--format', choices=('csv', 'jsonl'), default='csv')
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser('query', help='Filter hotels in a results file')
+    p.add_argument('input', help='Results JSON file')
+    p.add_argument('--amenity', action='append', help='Required canonical amenity (repeatable)')
+    p.add_argument('--max-price', type=float, default=None)
+    p.add_argument('--min-rating', type=float, default=None)
+    p.add_argument('--name', help='Substring of the hotel name')
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser('reextract', help='Re-run extractors over archived snapshots')
+    p.add_argument('--archive', default=SNAPSHOT_DIR)
+    p.add_argument('--output', default=f"{DATA_DIR}/reextracted.json")
+    p.add_argument('--workers', type=int, default=None)
+    p.set_defaults(func=cmd_reextract)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,16 +3,30 @@ import os
 # Browser settings
 CHROME_BINARY_PATH = '/usr/bin/chromium'
 CHROMEDRIVER_PATH = '/usr/bin/chromedriver'
+USER_AGENT = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+              'AppleWebKit/537.36 (KHTML, like Gecko) '
+              'Chrome/120.0.0.0 Safari/537.36')
+
+# Remote WebDriver nodes as "url=capacity,url=capacity"; empty runs locally
+REMOTE_WEBDRIVER_NODES = os.environ.get('REMOTE_WEBDRIVER_NODES', '')
+NODE_HEALTH_INTERVAL = 30
 
 # Data settings
 DATA_DIR = '/app/data'
 DEFAULT_OUTPUT_FILE = 'hotel_data.json'
+AMENITY_VOCAB_FILE = os.path.join(DATA_DIR, 'amenity_vocabulary.json')
+PRICE_STATE_FILE = os.path.join(DATA_DIR, 'price_state.json')
+SNAPSHOT_DIR = os.path.join(DATA_DIR, 'snapshots')
 
 # Scraping settings
 DEFAULT_TIMEOUT = 10
 MAX_RETRIES = 3
 RETRY_DELAY = 2
 
+# Browser recycling (the container is limited to 4G in docker-compose.yml)
+MAX_BROWSER_RSS_MB = 2500
+MAX_PAGES_PER_DRIVER = 40
+
 # Selectors for different elements
 SELECTORS = {
     'hotel_card': 'div[class*="yuAt yuAt-pres-rounded"]',
@@ -26,5 +40,7 @@ SELECTORS = {
     'room_card': '.c5l3f',
 }
 
-# Create data directory if it doesn't exist
-os.makedirs(DATA_DIR, exist_ok=True)
\ No newline at end of file
+def ensure_data_dir():
+    """Create the data directory if it doesn't exist"""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return DATA_DIR
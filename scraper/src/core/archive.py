@@ -0,0 +1,77 @@
+"""Compressed archive of raw page snapshots for offline re-extraction."""
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from ..config.settings import SNAPSHOT_DIR
+
+
+class SnapshotArchive:
+    """Store gzipped page sources keyed by URL and timestamp.
+
+    Each snapshot is written to ``<root>/<date>/<kind>/<url hash>-<time>.html.gz``
+    and recorded as one line in ``<root>/index.jsonl`` together with the
+    search context (city and dates), so the archive can be replayed without
+    re-crawling.
+    """
+
+    def __init__(self, root=SNAPSHOT_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, 'index.jsonl')
+
+    @staticmethod
+    def url_hash(url):
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()[:16]
+
+    def save(self, url, html, kind, context=None, timestamp=None):
+        """Compress and store one page source; returns its index entry"""
+        timestamp = timestamp or datetime.now()
+        relpath = os.path.join(
+            timestamp.strftime('%Y-%m-%d'),
+            kind,
+            f"{self.url_hash(url)}-{timestamp.strftime('%H%M%S%f')}.html.gz"
+        )
+        path = os.path.join(self.root, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html)
+
+        entry = {
+            'url': url,
+            'kind': kind,
+            'timestamp': timestamp.isoformat(timespec='seconds'),
+            'path': relpath,
+            'context': context or {},
+        }
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        return entry
+
+    def entries(self, kind=None, since=None, until=None):
+        """Yield index entries, optionally filtered by kind and ISO timestamp range"""
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                if kind and entry['kind'] != kind:
+                    continue
+                if since and entry['timestamp'] < since:
+                    continue
+                if until and entry['timestamp'] > until:
+                    continue
+                yield entry
+
+    def read(self, entry):
+        """Return the decompressed page source for an index entry"""
+        return read_snapshot(os.path.join(self.root, entry['path']))
+
+
+def read_snapshot(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return f.read()
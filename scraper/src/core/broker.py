@@ -0,0 +1,214 @@
+"""Session broker that leases browser sessions from a pool of WebDriver nodes."""
+import json
+import subprocess
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+
+from ..config.settings import (
+    CHROMEDRIVER_PATH,
+    NODE_HEALTH_INTERVAL,
+    REMOTE_WEBDRIVER_NODES,
+)
+from .driver import WebDriverManager
+
+
+class NoSessionAvailable(Exception):
+    """Raised when no healthy node has a free slot before the timeout"""
+
+
+class BrowserNode:
+    """One remote WebDriver endpoint with a fixed number of session slots"""
+
+    def __init__(self, url, capacity=1):
+        self.url = url.rstrip('/')
+        self.capacity = capacity
+        self.active = 0
+        self.healthy = True
+        self.last_check = float('-inf')  # never checked
+        self.failures = 0
+        self.checking = False  # a health check is in flight
+
+    @property
+    def load(self):
+        return self.active / self.capacity if self.capacity else 1.0
+
+    @property
+    def available(self):
+        return self.healthy and self.active < self.capacity
+
+    def probe(self, timeout=5):
+        """Query the node's /status endpoint; returns whether it is ready"""
+        try:
+            with urllib.request.urlopen(f"{self.url}/status", timeout=timeout) as response:
+                status = json.loads(response.read().decode('utf-8'))
+            return bool(status.get('value', {}).get('ready', True))
+        except Exception:
+            return False
+
+    def check_health(self, timeout=5):
+        """Probe the node and update ``healthy``"""
+        self.healthy = self.probe(timeout)
+        self.last_check = time.monotonic()
+        return self.healthy
+
+    def __repr__(self):
+        state = 'up' if self.healthy else 'down'
+        return f"BrowserNode({self.url}, {self.active}/{self.capacity}, {state})"
+
+
+def parse_nodes(spec):
+    """Parse ``url=capacity,url=capacity`` into BrowserNode objects"""
+    nodes = []
+    for item in spec.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        url, _, capacity = item.rpartition('=') if '=' in item else (item, '', '1')
+        nodes.append(BrowserNode(url, int(capacity or 1)))
+    return nodes
+
+
+class SessionBroker:
+    """Lease browser sessions to scraper jobs with least-loaded placement.
+
+    Each lease opens a ``webdriver.Remote`` session on the healthy node with
+    the lowest active/capacity ratio. Nodes are health-checked before
+    placement when their last check is older than ``health_interval``, and a
+    node that fails to open a session is marked down until its next check.
+    """
+
+    def __init__(self, nodes=None, health_interval=NODE_HEALTH_INTERVAL,
+                 driver_factory=None):
+        if nodes is None:
+            nodes = parse_nodes(REMOTE_WEBDRIVER_NODES)
+        self.nodes = list(nodes)
+        self.health_interval = health_interval
+        self.driver_factory = driver_factory or WebDriverManager.create_driver
+        self.leases = {}  # id(driver) -> node
+        self._condition = threading.Condition()
+
+    def refresh_health(self, force=False):
+        """Re-check nodes whose health is stale.
+
+        Nodes are claimed under the lock, so concurrent callers never probe
+        the same node twice; the probes themselves run outside it.
+        """
+        with self._condition:
+            now = time.monotonic()
+            stale = [node for node in self.nodes if not node.checking
+                     and (force or now - node.last_check >= self.health_interval)]
+            for node in stale:
+                node.checking = True
+
+        for node in stale:
+            healthy = node.probe()
+            with self._condition:
+                node.healthy = healthy
+                node.last_check = time.monotonic()
+                node.checking = False
+                self._condition.notify_all()
+
+    def _pick_node(self):
+        candidates = [node for node in self.nodes if node.available]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda node: (node.load, node.active))
+
+    def acquire(self, timeout=60):
+        """Open a session on the least-loaded node; returns the driver"""
+        deadline = time.monotonic() + timeout
+        while True:
+            self.refresh_health()
+            with self._condition:
+                node = self._pick_node()
+                if node is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise NoSessionAvailable(f"No free browser session on {self.nodes}")
+                    # Wake up on release, or re-check health periodically
+                    self._condition.wait(min(remaining, self.health_interval))
+                    continue
+                node.active += 1
+
+            try:
+                driver = self.driver_factory(remote_url=node.url)
+            except Exception:
+                with self._condition:
+                    node.active -= 1
+                    node.failures += 1
+                    node.healthy = False
+                    node.last_check = time.monotonic()
+                    self._condition.notify_all()
+                continue
+
+            with self._condition:
+                self.leases[id(driver)] = node
+            return driver
+
+    def release(self, driver):
+        """Quit a leased session and free its slot"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            node = self.leases.pop(id(driver), None)
+            if node:
+                node.active -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def lease(self, timeout=60):
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def stats(self):
+        return [
+            {'url': node.url, 'active': node.active, 'capacity': node.capacity,
+             'healthy': node.healthy, 'failures': node.failures}
+            for node in self.nodes
+        ]
+
+
+def launch_local_nodes(count, capacity=1, base_port=9515, chromedriver=CHROMEDRIVER_PATH,
+                       timeout=10):
+    """Start local chromedriver processes that stand in for remote nodes.
+
+    Returns ``(processes, nodes)``; terminate the processes when done. If
+    any node is not answering /status within ``timeout`` seconds, every
+    started process is terminated and RuntimeError is raised.
+    """
+    processes = []
+    nodes = []
+    try:
+        for i in range(count):
+            port = base_port + i
+            processes.append(subprocess.Popen(
+                [chromedriver, f'--port={port}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            ))
+            nodes.append(BrowserNode(f"http://127.0.0.1:{port}", capacity))
+
+        # Wait until every node answers /status
+        deadline = time.monotonic() + timeout
+        while not all([node.check_health(timeout=1) for node in nodes]):
+            if time.monotonic() >= deadline:
+                down = [node.url for node in nodes if not node.healthy]
+                raise RuntimeError(f"Local nodes not ready after {timeout}s: {', '.join(down)}")
+            time.sleep(0.2)
+    except BaseException:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        raise
+    return processes, nodes
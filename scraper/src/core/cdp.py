@@ -0,0 +1,399 @@
+"""Direct Chrome DevTools Protocol backend over a persistent websocket.
+
+Skips the chromedriver HTTP hop: one asyncio websocket to the browser
+carries every command, and each page is a flattened target session on
+that connection, so many pages can share one browser process.
+"""
+import asyncio
+import json
+import shutil
+import tempfile
+
+from ..config.settings import CHROME_BINARY_PATH, DEFAULT_TIMEOUT, USER_AGENT
+
+CHROME_ARGS = [
+    '--headless=new',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+    '--disable-blink-features=AutomationControlled',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--remote-debugging-port=0',
+]
+
+HIDE_WEBDRIVER = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+
+class CDPError(Exception):
+    """Raised when Chrome returns an error for a DevTools command"""
+
+
+class CDPConnection:
+    """A single websocket to the browser with request/response multiplexing"""
+
+    def __init__(self, ws, http_session):
+        self.ws = ws
+        self.http_session = http_session
+        self._next_id = 0
+        self._pending = {}    # command id -> future
+        self._listeners = {}  # (session id, event method) -> list of futures
+        self._reader = asyncio.ensure_future(self._read_loop())
+
+    @classmethod
+    async def connect(cls, ws_url):
+        import aiohttp
+
+        http_session = aiohttp.ClientSession()
+        ws = await http_session.ws_connect(ws_url, max_msg_size=0)
+        return cls(ws, http_session)
+
+    async def _read_loop(self):
+        import aiohttp
+
+        try:
+            async for msg in self.ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                data = json.loads(msg.data)
+                if 'id' in data:
+                    future = self._pending.pop(data['id'], None)
+                    if future and not future.done():
+                        if 'error' in data:
+                            future.set_exception(CDPError(data['error'].get('message')))
+                        else:
+                            future.set_result(data.get('result', {}))
+                else:
+                    key = (data.get('sessionId'), data.get('method'))
+                    for future in self._listeners.pop(key, []):
+                        if not future.done():
+                            future.set_result(data.get('params', {}))
+        finally:
+            waiting = list(self._pending.values())
+            for futures in self._listeners.values():
+                waiting.extend(futures)
+            for future in waiting:
+                if not future.done():
+                    future.set_exception(CDPError('Connection closed'))
+            self._pending.clear()
+            self._listeners.clear()
+
+    async def send(self, method, params=None, session_id=None, timeout=DEFAULT_TIMEOUT):
+        """Send one command and wait for its result"""
+        self._next_id += 1
+        command_id = self._next_id
+        message = {'id': command_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[command_id] = future
+        try:
+            await self.ws.send_str(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            # Drop the future if the command timed out or failed to send
+            self._pending.pop(command_id, None)
+
+    def wait_for_event(self, method, session_id=None):
+        """Return a future resolved by the next matching event"""
+        future = asyncio.get_running_loop().create_future()
+        self._listeners.setdefault((session_id, method), []).append(future)
+        return future
+
+    async def close(self):
+        await self.ws.close()
+        await self.http_session.close()
+        self._reader.cancel()
+
+
+class CDPPage:
+    """Adapter for the page operations the scraper uses.
+
+    Mirrors the Selenium calls in KayakHotelScraper: navigate, run script,
+    query element text and attributes, and read the page source.
+    """
+
+    def __init__(self, connection, target_id, session_id):
+        self.connection = connection
+        self.target_id = target_id
+        self.session_id = session_id
+
+    async def send(self, method, params=None, timeout=DEFAULT_TIMEOUT):
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    async def get(self, url, timeout=DEFAULT_TIMEOUT):
+        """Navigate and wait for the load event"""
+        loaded = self.connection.wait_for_event('Page.loadEventFired', self.session_id)
+        result = await self.send('Page.navigate', {'url': url}, timeout)
+        if result.get('errorText'):
+            loaded.cancel()
+            raise CDPError(f"Navigation failed: {result['errorText']}")
+        await asyncio.wait_for(loaded, timeout)
+        return result
+
+    async def evaluate(self, expression, timeout=DEFAULT_TIMEOUT):
+        """Evaluate a JavaScript expression and return its JSON value"""
+        result = await self.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True,
+        }, timeout)
+        if result.get('exceptionDetails'):
+            details = result['exceptionDetails']
+            message = details.get('exception', {}).get('description') or details.get('text')
+            raise CDPError(f"Script error: {message}")
+        return result.get('result', {}).get('value')
+
+    async def execute_script(self, script, timeout=DEFAULT_TIMEOUT):
+        """Run a Selenium-style script body (using ``return``)"""
+        return await self.evaluate(f"(() => {{ {script} }})()", timeout)
+
+    async def query_text(self, selector, parent=None):
+        """Text of the first element matching selector, or None"""
+        return await self.evaluate(
+            f"(() => {{ const e = {self._root(parent)}.querySelector({json.dumps(selector)});"
+            f" return e ? e.innerText.trim() : null; }})()"
+        )
+
+    async def query_all_text(self, selector, parent=None):
+        """Text of every element matching selector"""
+        return await self.evaluate(
+            f"Array.from({self._root(parent)}.querySelectorAll({json.dumps(selector)}),"
+            f" e => e.innerText.trim())"
+        )
+
+    async def query_attribute(self, selector, attribute, parent=None):
+        """Attribute of the first element matching selector, or None"""
+        return await self.evaluate(
+            f"(() => {{ const e = {self._root(parent)}.querySelector({json.dumps(selector)});"
+            f" return e ? e.getAttribute({json.dumps(attribute)}) : null; }})()"
+        )
+
+    async def query_all_attribute(self, selector, attribute, parent=None):
+        """Attribute of every element matching selector"""
+        return await self.evaluate(
+            f"Array.from({self._root(parent)}.querySelectorAll({json.dumps(selector)}),"
+            f" e => e.getAttribute({json.dumps(attribute)}))"
+        )
+
+    @staticmethod
+    def _root(parent):
+        if parent is None:
+            return 'document'
+        return f"document.querySelector({json.dumps(parent)})"
+
+    async def page_source(self):
+        return await self.evaluate('document.documentElement.outerHTML')
+
+    async def get_cookies(self):
+        result = await self.send('Network.getCookies')
+        return result.get('cookies', [])
+
+    async def close(self):
+        await self.connection.send('Target.closeTarget', {'targetId': self.target_id})
+
+
+class CDPBrowser:
+    """Launch Chromium and open page sessions over one DevTools websocket"""
+
+    def __init__(self, process, connection, user_data_dir, stderr_task=None):
+        self.process = process
+        self.connection = connection
+        self.user_data_dir = user_data_dir
+        # Held here because the event loop only keeps weak task references
+        self.stderr_task = stderr_task
+
+    @classmethod
+    async def launch(cls, binary=CHROME_BINARY_PATH, extra_args=None, timeout=30):
+        user_data_dir = tempfile.mkdtemp(prefix='cdp-profile-')
+        args = CHROME_ARGS + [f'--user-data-dir={user_data_dir}', f'--user-agent={USER_AGENT}']
+        process = await asyncio.create_subprocess_exec(
+            binary, *args, *(extra_args or []), 'about:blank',
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+        # Chrome prints the browser websocket URL on stderr once it is ready
+        async def read_ws_url():
+            while True:
+                line = await process.stderr.readline()
+                if not line:
+                    raise CDPError('Chrome exited before DevTools was ready')
+                text = line.decode(errors='replace').strip()
+                if text.startswith('DevTools listening on '):
+                    return text[len('DevTools listening on '):]
+
+        try:
+            ws_url = await asyncio.wait_for(read_ws_url(), timeout)
+        except Exception:
+            process.kill()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+
+        # Keep draining stderr so Chrome never blocks on a full pipe
+        stderr_task = asyncio.ensure_future(cls._drain(process.stderr))
+        try:
+            connection = await CDPConnection.connect(ws_url)
+        except Exception:
+            stderr_task.cancel()
+            process.kill()
+            shutil.rmtree(user_data_dir, ignore_errors=True)
+            raise
+        return cls(process, connection, user_data_dir, stderr_task)
+
+    @staticmethod
+    async def _drain(stream):
+        while await stream.readline():
+            pass
+
+    async def new_page(self):
+        """Open a tab as a flattened session with the anti-bot setup applied"""
+        target = await self.connection.send('Target.createTarget', {'url': 'about:blank'})
+        attached = await self.connection.send('Target.attachToTarget', {
+            'targetId': target['targetId'],
+            'flatten': True,
+        })
+        page = CDPPage(self.connection, target['targetId'], attached['sessionId'])
+        await asyncio.gather(
+            page.send('Page.enable'),
+            page.send('Runtime.enable'),
+            page.send('Network.setUserAgentOverride', {
+                'userAgent': USER_AGENT,
+                'platform': 'Windows'
+            }),
+            page.send('Page.addScriptToEvaluateOnNewDocument', {'source': HIDE_WEBDRIVER}),
+        )
+        return page
+
+    @property
+    def pid(self):
+        return self.process.pid
+
+    async def close(self):
+        try:
+            await self.connection.send('Browser.close', timeout=5)
+        except Exception:
+            pass
+        await self.connection.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), 5)
+        except asyncio.TimeoutError:
+            self.process.kill()
+        if self.stderr_task:
+            self.stderr_task.cancel()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+# Benchmark against the Selenium backend on a local fixture server
+
+FIXTURE_HTML = """<!doctype html><html><head><title>Fixture {page}</title></head><body>
+<div class="S0Ps-resultInner"><a class="FLpo-big-name" href="/hotel/{page}">Hotel {page}</a>
+<div class="upS4-big-name">Somewhere</div><div class="c1XBO">$1{page:03d}</div></div>
+{filler}
+</body></html>"""
+
+
+def _start_fixture_server():
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    filler = '<p>' + 'lorem ipsum ' * 2000 + '</p>'
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            try:
+                page = int(self.path.rsplit('/', 1)[-1] or 0)
+            except ValueError:
+                page = 0
+            body = FIXTURE_HTML.format(page=page, filler=filler).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _benchmark_cdp(base_url, pages, concurrency, commands):
+    import time
+
+    browser = await CDPBrowser.launch()
+    try:
+        tabs = [await browser.new_page() for _ in range(concurrency)]
+        await tabs[0].get(f"{base_url}/0")
+
+        start = time.perf_counter()
+        for _ in range(commands):
+            await tabs[0].evaluate('1')
+        latency = (time.perf_counter() - start) / commands
+
+        queue = asyncio.Queue()
+        for i in range(pages):
+            queue.put_nowait(i)
+
+        async def worker(tab):
+            while not queue.empty():
+                i = queue.get_nowait()
+                await tab.get(f"{base_url}/{i}")
+                await tab.query_text('a.FLpo-big-name')
+                await tab.query_attribute('a.FLpo-big-name', 'href')
+                await tab.page_source()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(tab) for tab in tabs))
+        elapsed = time.perf_counter() - start
+        return {'command_latency_ms': latency * 1000, 'pages_per_sec': pages / elapsed}
+    finally:
+        await browser.close()
+
+
+def _benchmark_selenium(base_url, pages, commands):
+    import time
+    from selenium.webdriver.common.by import By
+    from .driver import WebDriverManager
+
+    driver = WebDriverManager.create_driver()
+    try:
+        driver.implicitly_wait(0)
+        driver.get(f"{base_url}/0")
+
+        start = time.perf_counter()
+        for _ in range(commands):
+            driver.execute_script('return 1')
+        latency = (time.perf_counter() - start) / commands
+
+        start = time.perf_counter()
+        for i in range(pages):
+            driver.get(f"{base_url}/{i}")
+            elem = driver.find_element(By.CSS_SELECTOR, 'a.FLpo-big-name')
+            elem.text
+            elem.get_attribute('href')
+            driver.page_source
+        elapsed = time.perf_counter() - start
+        return {'command_latency_ms': latency * 1000, 'pages_per_sec': pages / elapsed}
+    finally:
+        driver.quit()
+
+
+def benchmark(pages=200, concurrency=4, commands=500, selenium=True):
+    """Compare command latency and pages/sec of the CDP and Selenium backends"""
+    server = _start_fixture_server()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/page"
+    try:
+        results = {'cdp': asyncio.run(_benchmark_cdp(base_url, pages, concurrency, commands))}
+        if selenium:
+            results['selenium'] = _benchmark_selenium(base_url, pages, commands)
+        return results
+    finally:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    print(json.dumps(benchmark(), indent=2))
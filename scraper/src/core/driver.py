@@ -1,45 +1,58 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from ..config.settings import CHROME_BINARY_PATH, CHROMEDRIVER_PATH
+from ..config.settings import CHROME_BINARY_PATH, CHROMEDRIVER_PATH, USER_AGENT
 
 class WebDriverManager:
     @staticmethod
-    def create_driver():
-        """Create and configure Chrome WebDriver"""
+    def create_options(local=True):
+        """Build Chrome options shared by the local and remote backends"""
         chrome_options = Options()
-        
+
         # Basic Chrome options
         chrome_options.add_argument('--headless')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.binary_location = CHROME_BINARY_PATH
-        
+        if local:
+            # Remote nodes use their own Chrome install
+            chrome_options.binary_location = CHROME_BINARY_PATH
+
         # Anti-bot detection options
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
-        
+
         # Set realistic user agent
-        user_agent = ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                     'AppleWebKit/537.36 (KHTML, like Gecko) '
-                     'Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument(f'user-agent={user_agent}')
-
-        service = Service(executable_path=CHROMEDRIVER_PATH)
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
-        # Additional anti-bot configurations
-        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": user_agent,
-            "platform": "Windows"
-        })
-        
+        chrome_options.add_argument(f'user-agent={USER_AGENT}')
+        return chrome_options
+
+    @staticmethod
+    def create_driver(remote_url=None):
+        """Create and configure Chrome WebDriver.
+
+        Starts a local chromedriver by default; pass ``remote_url`` to open
+        a session on a remote WebDriver node (chromedriver or Selenium Grid).
+        """
+        if remote_url:
+            chrome_options = WebDriverManager.create_options(local=False)
+            driver = webdriver.Remote(command_executor=remote_url, options=chrome_options)
+        else:
+            chrome_options = WebDriverManager.create_options()
+            service = Service(executable_path=CHROMEDRIVER_PATH)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+
+        # Additional anti-bot configurations (CDP is only exposed by local drivers)
+        if hasattr(driver, 'execute_cdp_cmd'):
+            driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+                "userAgent": USER_AGENT,
+                "platform": "Windows"
+            })
+
         driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
         )
-        
+
         driver.implicitly_wait(10)
-        return driver
\ No newline at end of file
+        return driver
@@ -0,0 +1,131 @@
+"""Browser resource monitoring for long scraping runs."""
+import os
+import time
+
+from ..config.settings import MAX_BROWSER_RSS_MB, MAX_PAGES_PER_DRIVER
+
+
+def _children(pid):
+    """Direct children of a process, read from /proc"""
+    # Each thread lists only the children it forked itself, so every
+    # thread's file is read; a thread exiting mid-read falls back below
+    children = []
+    try:
+        for tid in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{tid}/children', 'r') as f:
+                children.extend(int(p) for p in f.read().split())
+        return children
+    except OSError:
+        pass
+
+    # Kernels without the children file: scan parent pids instead
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', 'r') as f:
+                # The command name may contain spaces, so split after it
+                fields = f.read().rsplit(')', 1)[1].split()
+            if int(fields[1]) == pid:
+                children.append(int(entry))
+        except (OSError, IndexError, ValueError):
+            continue
+    return children
+
+
+def process_tree(pid):
+    """The process and all its descendants"""
+    pids = []
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        pids.append(current)
+        stack.extend(_children(current))
+    return pids
+
+
+def process_rss_mb(pid):
+    """Resident set size of one process in MB, 0 if it is gone"""
+    try:
+        with open(f'/proc/{pid}/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0.0
+
+
+class ResourceMonitor:
+    """Sample browser memory and tab count, and decide when to recycle.
+
+    RSS is summed over the chromedriver process and every process it
+    spawned (Chromium's browser, renderer and GPU processes). A recycle is
+    due once the total passes ``max_rss_mb`` or the driver has loaded
+    ``max_pages`` pages.
+    """
+
+    def __init__(self, max_rss_mb=MAX_BROWSER_RSS_MB, max_pages=MAX_PAGES_PER_DRIVER):
+        self.max_rss_mb = max_rss_mb
+        self.max_pages = max_pages
+        self.started = time.monotonic()
+        self.samples = []
+        self.pages = 0
+        self.total_pages = 0
+        self.recycles = 0
+
+    @staticmethod
+    def browser_pid(driver):
+        service = getattr(driver, 'service', None)
+        process = getattr(service, 'process', None)
+        return getattr(process, 'pid', None)
+
+    def browser_rss_mb(self, driver):
+        pid = self.browser_pid(driver)
+        if pid is None or not os.path.exists('/proc'):
+            return None
+        return sum(process_rss_mb(p) for p in process_tree(pid))
+
+    def page_loaded(self):
+        self.pages += 1
+        self.total_pages += 1
+
+    def sample(self, driver):
+        """Record one RSS/tab sample and return it"""
+        try:
+            tabs = len(driver.window_handles)
+        except Exception:
+            tabs = None
+        rss = self.browser_rss_mb(driver)
+        sample = {
+            'elapsed_seconds': round(time.monotonic() - self.started, 1),
+            'rss_mb': round(rss, 1) if rss is not None else None,
+            'tabs': tabs,
+            'pages': self.total_pages,
+            'driver_pages': self.pages,
+        }
+        self.samples.append(sample)
+        return sample
+
+    def should_recycle(self, sample):
+        """Return the reason a recycle is due, or None"""
+        if self.max_pages and self.pages >= self.max_pages:
+            return f"{self.pages} pages loaded"
+        if self.max_rss_mb and sample['rss_mb'] and sample['rss_mb'] >= self.max_rss_mb:
+            return f"browser RSS {sample['rss_mb']:.0f} MB"
+        return None
+
+    def recycled(self):
+        self.recycles += 1
+        self.pages = 0
+
+    def summary(self):
+        rss_values = [s['rss_mb'] for s in self.samples if s['rss_mb'] is not None]
+        return {
+            'max_rss_mb': self.max_rss_mb,
+            'max_pages_per_driver': self.max_pages,
+            'peak_rss_mb': max(rss_values) if rss_values else None,
+            'recycles': self.recycles,
+            'samples': self.samples,
+        }
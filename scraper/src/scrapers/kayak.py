@@ -2,6 +2,7 @@ import json
 import time
 import random
 import os
+import threading
 from datetime import datetime
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -10,6 +11,15 @@ from selenium.common.exceptions import TimeoutException, WebDriverException
 
 from src.core.driver import WebDriverManager
 from src.core.logger import setup_logger
+from src.core.archive import SnapshotArchive
+from src.core.monitor import ResourceMonitor
+from src.config.settings import (
+    AMENITY_VOCAB_FILE,
+    MAX_RETRIES,
+    PRICE_STATE_FILE,
+    RETRY_DELAY,
+    ensure_data_dir
+)
 from src.utils.retry import (
     wait_for_element, 
     wait_for_elements, 
@@ -17,26 +27,104 @@ from src.utils.retry import (
     scroll_into_view
 )
 from src.utils.selectors import *
+from src.utils.amenities import AmenityVocabulary
+from src.utils.images import ImageCollector
+from src.utils.prices import parse_price
+
+# Fields that can be requested through the ``fields`` projection.
+# Hotel name and detail URL are always extracted.
+SEARCH_FIELDS = {'location', 'reviews', 'price', 'images'}
+DETAIL_FIELDS = {'images', 'rooms', 'amenities'}
+ALL_FIELDS = SEARCH_FIELDS | DETAIL_FIELDS
 
 class KayakHotelScraper:
-    def __init__(self, city, check_in_date, check_out_date):
+    def __init__(self, city, check_in_date, check_out_date, change_detector=None,
+                 record=False, archive=None, fields=None, monitor=None, broker=None,
+                 amenity_vocab=None, state_lock=None):
         self.logger = setup_logger()
+        ensure_data_dir()
+        self.fields = set(fields) if fields is not None else set(ALL_FIELDS)
+        unknown = self.fields - ALL_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
         self.city = city
         self.check_in_date = check_in_date
         self.check_out_date = check_out_date
         self.base_url = "https://www.kayak.com/hotels"
         self.hotels_data = []
+        # A vocabulary passed in is shared with other scrapers and saved by
+        # its owner; the lock guards it and the detector across threads
+        self.shared_state = amenity_vocab is not None
+        self.amenity_vocab = amenity_vocab or AmenityVocabulary.load(AMENITY_VOCAB_FILE)
+        self.change_detector = change_detector
+        self.state_lock = state_lock or threading.Lock()
+        self.archive = archive or (SnapshotArchive() if record else None)
+        self.price_events = []
+        self.timings = []
+        self.monitor = monitor or ResourceMonitor()
+        self.broker = broker
         self.driver = None
         self.setup_driver()
         
     def setup_driver(self):
         try:
-            self.driver = WebDriverManager.create_driver()
+            if self.broker:
+                self.driver = self.broker.acquire()
+            else:
+                self.driver = WebDriverManager.create_driver()
             self.logger.info("WebDriver initialized successfully")
         except Exception as e:
             self.logger.error(f"Failed to initialize WebDriver: {str(e)}")
             raise
 
+    def check_resources(self, position=None):
+        """Sample browser resources and recycle the driver if a limit is hit"""
+        try:
+            sample = self.monitor.sample(self.driver)
+            reason = self.monitor.should_recycle(sample)
+            if reason:
+                self.logger.info(f"Recycling WebDriver at hotel {position}: {reason}")
+                self.recycle_driver()
+        except Exception as e:
+            self.logger.error(f"Error checking browser resources: {str(e)}")
+
+    def recycle_driver(self, max_retries=MAX_RETRIES):
+        """Replace the driver with a fresh one, keeping cookies and current page.
+
+        Starting the new driver is retried; if every attempt fails the error
+        is raised and ``self.driver`` stays None.
+        """
+        cookies = []
+        current_url = None
+        try:
+            cookies = self.driver.get_cookies()
+            current_url = self.driver.current_url
+        except Exception as e:
+            self.logger.warning(f"Could not read session state before recycling: {str(e)}")
+
+        self.close()
+        for attempt in range(max_retries):
+            try:
+                self.setup_driver()
+                break
+            except Exception:
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(RETRY_DELAY * 2 ** attempt)
+        self.monitor.recycled()
+
+        if cookies:
+            # Cookies can only be set for the domain currently loaded
+            self.driver.get(self.base_url)
+            for cookie in cookies:
+                cookie.pop('sameSite', None)
+                try:
+                    self.driver.add_cookie(cookie)
+                except Exception:
+                    continue
+        if current_url and current_url.startswith('http'):
+            self.load_page(current_url)
+
     def construct_search_url(self):
         check_in = self.check_in_date.strftime('%Y-%m-%d')
         check_out = self.check_out_date.strftime('%Y-%m-%d')
@@ -66,6 +154,7 @@ class KayakHotelScraper:
             try:
                 self.logger.info(f"Loading URL (attempt {attempt + 1}): {url}")
                 self.driver.get(url)
+                self.monitor.page_loaded()
                 wait_for_page_load(self.driver)
                 self.handle_popups()
                 
@@ -84,26 +173,31 @@ class KayakHotelScraper:
                 time.sleep(2 ** attempt)
         return False
 
+    def record_snapshot(self, url, kind):
+        """Archive the current page source when running in record mode"""
+        if not self.archive:
+            return
+        try:
+            context = {
+                'city': self.city,
+                'check_in': self.check_in_date.strftime('%Y-%m-%d'),
+                'check_out': self.check_out_date.strftime('%Y-%m-%d')
+            }
+            self.archive.save(url, self.driver.page_source, kind, context)
+        except Exception as e:
+            self.logger.error(f"Error recording snapshot: {str(e)}")
+
     def extract_room_price(self, room_elem):
-        """Extract price from room element with multiple selectors"""
+        """Extract parsed price (amount, currency, labels) from room element"""
         try:
             # Try different price selectors in order of preference
-            price_selectors = [
-                'span.C9NJ-amount',
-                'div.C9NJ-amount', 
-                'div.Ptt7-price',
-                'div.c1XBO',
-                'div[class*="price"]'
-            ]
-            
-            for selector in price_selectors:
+            for selector in ROOM_PRICE_SELECTORS:
                 try:
                     price_elem = room_elem.find_element(By.CSS_SELECTOR, selector)
                     if price_elem:
-                        price_text = price_elem.text.strip()
-                        # Extract numeric price
-                        price = float(''.join(filter(str.isdigit, price_text.replace(',', ''))))
-                        return price
+                        price = parse_price(price_elem.text.strip())
+                        if price:
+                            return price
                 except:
                     continue
             return None
@@ -128,6 +222,7 @@ class KayakHotelScraper:
                     room_info = {
                         'room_type': None,
                         'price': None,
+                        'currency': None,
                         'bed_configuration': None,
                         'cancellation_policy': None,
                         'board_type': None,
@@ -146,7 +241,8 @@ class KayakHotelScraper:
                     # Price from provider section
                     price = self.extract_room_price(room_elem)
                     if price:
-                        room_info['price'] = price
+                        room_info['price'] = price['amount']
+                        room_info['currency'] = price['currency']
                     
                     # Bed configuration
                     bed_elems = room_elem.find_elements(By.CSS_SELECTOR, 'div.c_Hjx-detail-amenity')
@@ -184,6 +280,7 @@ class KayakHotelScraper:
     def extract_amenities(self):
         """Extract all amenities from the detail page"""
         amenities = []
+        seen = set()
         try:
             # First find the amenities section
             amenities_section = wait_for_element(self.driver, '.tYfO[data-section-name="amenities"]')
@@ -200,7 +297,8 @@ class KayakHotelScraper:
             for elem in amenity_elements:
                 try:
                     amenity = elem.text.strip()
-                    if amenity and amenity not in amenities:
+                    if amenity and amenity not in seen:
+                        seen.add(amenity)
                         amenities.append(amenity)
                 except:
                     continue
@@ -217,7 +315,8 @@ class KayakHotelScraper:
                     for elem in modal_amenities:
                         try:
                             amenity = elem.text.strip()
-                            if amenity and amenity not in amenities:
+                            if amenity and amenity not in seen:
+                                seen.add(amenity)
                                 amenities.append(amenity)
                         except:
                             continue
@@ -233,7 +332,7 @@ class KayakHotelScraper:
             self.logger.error(f"Error extracting amenities: {str(e)}")
             return []
 
-    def extract_hotel_details(self, detail_url):
+    def extract_hotel_details(self, detail_url, collector=None):
         """Get detailed information from hotel page"""
         try:
             self.logger.info(f"Loading detail page: {detail_url}")
@@ -242,23 +341,31 @@ class KayakHotelScraper:
             
             details = {}
             
-            # Extract detail page images
-            images = self.extract_detail_page_images()
+            # Extract detail page images, merged with any search page images
+            images = self.extract_detail_page_images(collector) if 'images' in self.fields else None
             if images:
                 details['images'] = images  # Store images directly in details
-                self.logger.info(f"Found {len(images)} detail images")
+                self.logger.info(f"Found {len(images)} images")
             
             # Extract rooms
-            rooms = self.extract_room_details()
+            rooms = self.extract_room_details() if 'rooms' in self.fields else None
             if rooms:
                 details['rooms'] = rooms
                 self.logger.info(f"Found {len(rooms)} room types")
             
             # Extract amenities
-            amenities = self.extract_amenities()
+            amenities = self.extract_amenities() if 'amenities' in self.fields else None
             if amenities:
                 details['amenities'] = amenities
+                with self.state_lock:
+                    normalized = self.amenity_vocab.normalize(amenities)
+                details['amenity_keys'] = normalized['canonical']
+                details['amenity_categories'] = normalized['categories']
+                details['amenity_bitset'] = normalized['bitset']
                 self.logger.info(f"Found {len(amenities)} amenities")
+
+            # Snapshot after extraction so the expanded amenities are included
+            self.record_snapshot(detail_url, 'detail')
             
             return details
             
@@ -278,28 +385,35 @@ class KayakHotelScraper:
                 info['detail_url'] = name_elem.get_attribute('href')
             
             # Extract location
-            location_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_LOCATION)
-            if location_elem:
-                info['location'] = location_elem.text.strip()
+            if 'location' in self.fields:
+                location_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_LOCATION)
+                if location_elem:
+                    info['location'] = location_elem.text.strip()
             
             # Extract rating and reviews
-            try:
-                rating_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_RATING)
-                reviews_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_REVIEWS)
-                
-                info['review_scores'] = {
-                    'rating': float(rating_elem.text.strip()),
-                    'count': int(''.join(filter(str.isdigit, reviews_elem.text)))
-                }
-            except:
-                info['review_scores'] = {'rating': None, 'count': None}
+            if 'reviews' in self.fields:
+                try:
+                    rating_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_RATING)
+                    reviews_elem = hotel_element.find_element(By.CSS_SELECTOR, HOTEL_REVIEWS)
+                    
+                    info['review_scores'] = {
+                        'rating': float(rating_elem.text.strip()),
+                        'count': int(''.join(filter(str.isdigit, reviews_elem.text)))
+                    }
+                except:
+                    info['review_scores'] = {'rating': None, 'count': None}
             
             # Extract price
-            try:
-                price_elem = hotel_element.find_element(By.CSS_SELECTOR, PRICE_AMOUNT)
-                info['price'] = price_elem.text.strip()
-            except:
-                info['price'] = None
+            if 'price' in self.fields:
+                try:
+                    price_elem = hotel_element.find_element(By.CSS_SELECTOR, PRICE_AMOUNT)
+                    info['price'] = price_elem.text.strip()
+                except:
+                    info['price'] = None
+
+                parsed_price = parse_price(info['price'])
+                info['price_amount'] = parsed_price['amount'] if parsed_price else None
+                info['price_currency'] = parsed_price['currency'] if parsed_price else None
             
             # Initialize empty images array
             info['images'] = []
@@ -311,87 +425,33 @@ class KayakHotelScraper:
             return None
 
 
-    def extract_detail_page_images(self):
-        """Extract all images from hotel detail page"""
-        detail_images = []
-        try:
-            # Wait for the photo container to be present
-            photo_container = wait_for_element(self.driver, '.c1E0k-photo-container')
-            if not photo_container:
-                self.logger.warning("Detail page photo container not found")
-                return []
-
-            # Get all photo items
-            photo_items = self.driver.find_elements(By.CSS_SELECTOR, '.f800.f800-mod-pres-default')
-            
-            for item in photo_items:
-                try:
-                    img_elem = item.find_element(By.CSS_SELECTOR, '.f800-image')
-                    src = img_elem.get_attribute('src')
-                    alt = img_elem.get_attribute('alt')
-                    
-                    if src and src not in [img['url'] for img in detail_images]:
-                        detail_images.append({
-                            'url': src,
-                            'alt': alt,
-                            'type': 'detail'
-                        })
-                except:
-                    continue
-
-            self.logger.info(f"Successfully extracted {len(detail_images)} images from detail page")
-            return detail_images
-
-        except Exception as e:
-            self.logger.error(f"Error extracting detail page images: {str(e)}")
-            return []
-
-
-
-
-    def extract_hotel_images(self, hotel_element):
+    def extract_hotel_images(self, hotel_element, collector=None):
         """Extract all available hotel images from search result"""
-        images = []
+        if collector is None:
+            collector = ImageCollector()
         try:
             # Find the photo container directly under the hotel element
-            photo_container = hotel_element.find_element(By.CSS_SELECTOR, '.e9fk-photoContainer')
+            photo_container = hotel_element.find_element(By.CSS_SELECTOR, SEARCH_PHOTO_CONTAINER)
             if not photo_container:
                 self.logger.warning("Photo container not found")
                 return []
 
             # Get the photo wrap element
-            photo_wrap = photo_container.find_element(By.CSS_SELECTOR, '.e9fk-photoWrap')
+            photo_wrap = photo_container.find_element(By.CSS_SELECTOR, SEARCH_PHOTO_WRAP)
             if not photo_wrap:
                 self.logger.warning("Photo wrap not found")
                 return []
 
             # Try both direct img and picture element approaches
+            alt = None
             try:
                 img_elem = photo_wrap.find_element(By.CSS_SELECTOR, 'img.e9fk-photo')
                 if img_elem:
-                    # Get main image src and alt
-                    src = img_elem.get_attribute('src')
+                    # Main image src plus the size variants from srcset;
+                    # the collector keeps one variant per asset
                     alt = img_elem.get_attribute('alt')
-                    if src:
-                        images.append({
-                            'url': src,
-                            'alt': alt,
-                            'type': 'main'
-                        })
-
-                    # Get additional sizes from srcset
-                    srcset = img_elem.get_attribute('srcset')
-                    if srcset:
-                        for src_entry in srcset.split(','):
-                            src_parts = src_entry.strip().split(' ')
-                            if len(src_parts) >= 1:
-                                url = src_parts[0]
-                                if url and url not in [img['url'] for img in images]:
-                                    images.append({
-                                        'url': url,
-                                        'alt': alt,
-                                        'type': 'high_res'
-                                    })
+                    collector.add(img_elem.get_attribute('src'), alt=alt, type='main')
+                    collector.add_srcset(img_elem.get_attribute('srcset'), alt=alt, type='main')
             except:
                 self.logger.debug("No direct img element found, trying picture element")
 
@@ -402,16 +462,11 @@ class KayakHotelScraper:
                     # Get source elements
                     source_elements = picture_elem.find_elements(By.CSS_SELECTOR, 'source')
                     for source in source_elements:
-                        srcset = source.get_attribute('srcset')
-                        if srcset and srcset.strip() not in [img['url'] for img in images]:
-                            images.append({
-                                'url': srcset.strip(),
-                                'alt': None,
-                                'type': 'mobile'
-                            })
+                        collector.add_srcset(source.get_attribute('srcset'), alt=alt, type='main')
             except:
                 self.logger.debug("No picture element found")
 
+            images = collector.images()
             if images:
                 self.logger.info(f"Successfully extracted {len(images)} images from search page")
             else:
@@ -424,40 +479,36 @@ class KayakHotelScraper:
             return []
 
 
-    def extract_detail_page_images(self):
+    def extract_detail_page_images(self, collector=None):
         """Extract all images from hotel detail page"""
-        detail_images = []
+        if collector is None:
+            collector = ImageCollector()
         try:
             # Wait for the photo container to be present
-            photo_container = wait_for_element(self.driver, '.c1E0k-photo-container')
+            photo_container = wait_for_element(self.driver, DETAIL_PHOTO_CONTAINER)
             if not photo_container:
                 self.logger.warning("Detail page photo container not found")
-                return []
+                return collector.images()
 
             # Get all photo items
-            photo_items = self.driver.find_elements(By.CSS_SELECTOR, '.f800.f800-mod-pres-default')
+            photo_items = self.driver.find_elements(By.CSS_SELECTOR, DETAIL_PHOTO_ITEM)
             
+            added = 0
             for item in photo_items:
                 try:
-                    img_elem = item.find_element(By.CSS_SELECTOR, '.f800-image')
-                    src = img_elem.get_attribute('src')
+                    img_elem = item.find_element(By.CSS_SELECTOR, DETAIL_PHOTO)
                     alt = img_elem.get_attribute('alt')
-                    
-                    if src and src not in [img['url'] for img in detail_images]:
-                        detail_images.append({
-                            'url': src,
-                            'alt': alt,
-                            'type': 'detail'
-                        })
+                    added += collector.add(img_elem.get_attribute('src'), alt=alt, type='detail')
+                    collector.add_srcset(img_elem.get_attribute('srcset'), alt=alt, type='detail')
                 except:
                     continue
 
-            self.logger.info(f"Successfully extracted {len(detail_images)} images from detail page")
-            return detail_images
+            self.logger.info(f"Successfully extracted {added} new images from detail page")
+            return collector.images()
 
         except Exception as e:
             self.logger.error(f"Error extracting detail page images: {str(e)}")
-            return []
+            return collector.images()
 
     def scrape_hotels(self, limit=None):
         """Main method to scrape hotel information"""
@@ -469,6 +520,7 @@ class KayakHotelScraper:
             
             # Get all hotel cards first
             hotel_elements = wait_for_elements(self.driver, HOTEL_CARD)
+            self.record_snapshot(search_url, 'search')
             if not hotel_elements:
                 self.logger.error("No hotel elements found")
                 return []
@@ -477,37 +529,76 @@ class KayakHotelScraper:
             
             # Store basic info and URLs first
             hotels_to_process = []
+            collectors = {}
+            card_seconds = {}
             for hotel_element in hotel_elements[:limit]:
                 try:
+                    started = time.perf_counter()
                     # Use our new method to extract all basic info including images
                     info = self.extract_hotel_basic_info(hotel_element)
                     if info and info.get('detail_url'):
+                        collector = ImageCollector()
+                        if 'images' in self.fields:
+                            info['images'] = self.extract_hotel_images(hotel_element, collector)
+                        collectors[info['detail_url']] = collector
+                        card_seconds[info['detail_url']] = time.perf_counter() - started
                         hotels_to_process.append(info)
                         self.logger.info(f"Extracted basic info for: {info.get('hotel_name', 'Unknown hotel')}")
                     
                 except Exception as e:
                     self.logger.error(f"Error extracting basic hotel info: {str(e)}")
                     continue
+
+            # Drop the card element references so they don't pin DOM nodes
+            # while detail pages are loaded
+            hotel_elements = None
             
+            # Skip the detail page entirely when the search cards cover
+            # every requested field
+            visit_details = bool(self.fields & DETAIL_FIELDS)
+            if not visit_details:
+                self.logger.info("Requested fields are on search cards, skipping detail pages")
+
             # Now process each hotel's details
-            for hotel_info in hotels_to_process:
+            for position, hotel_info in enumerate(hotels_to_process):
                 try:
-                    # Get detailed info including detail page images
-                    details = self.extract_hotel_details(hotel_info['detail_url'])
-                    if details.get('detail_images'):
-                        # Add detail images to the images array
-                        hotel_info['images'].extend(details.pop('detail_images'))
-                    hotel_info.update(details)
+                    self.check_resources(position)
+                    if self.driver is None:
+                        self.logger.error(
+                            f"No WebDriver after a failed recycle, stopping at hotel {position}"
+                        )
+                        break
+                    started = time.perf_counter()
+                    if visit_details:
+                        # Get detailed info; detail page images are merged into
+                        # the search page images through the shared collector
+                        details = self.extract_hotel_details(
+                            hotel_info['detail_url'],
+                            collectors.get(hotel_info['detail_url'])
+                        )
+                        hotel_info.update(details)
                     self.hotels_data.append(hotel_info)
+                    self.detect_changes(hotel_info)
                     
-                    # Return to search page
-                    self.load_page(search_url)
-                    time.sleep(random.uniform(1, 2))
+                    if visit_details:
+                        # Return to search page
+                        self.load_page(search_url)
+                        time.sleep(random.uniform(1, 2))
+
+                    # Timed after the return trip, which each detail visit costs
+                    self.timings.append(
+                        card_seconds.get(hotel_info['detail_url'], 0.0)
+                        + time.perf_counter() - started
+                    )
                     
                 except Exception as e:
                     self.logger.error(f"Error processing hotel details: {str(e)}")
                     continue
             
+            self.logger.info(
+                f"Profile {','.join(sorted(self.fields))}: "
+                f"{self.timing_summary()['avg_seconds_per_hotel']:.2f}s per hotel"
+            )
             self.format_output()
             return self.hotels_data
                 
@@ -517,11 +608,45 @@ class KayakHotelScraper:
 
 
 
+    def detect_changes(self, hotel_info):
+        """Feed a scraped hotel to the change detector and log its events"""
+        if not self.change_detector:
+            return
+        if not self.fields & {'price', 'rooms'}:
+            # No prices were extracted, so there is nothing to compare
+            return
+        try:
+            with self.state_lock:
+                events = self.change_detector.observe(
+                    hotel_info, self.check_in_date, self.check_out_date
+                )
+            for event in events:
+                self.logger.info(
+                    f"Price event {event['type']}: {event['hotel_name']} "
+                    f"{event['room_type'] or ''} {event.get('new_price', '')}".strip()
+                )
+            self.price_events.extend(events)
+        except Exception as e:
+            self.logger.error(f"Error detecting price changes: {str(e)}")
+
+    def timing_summary(self):
+        """Per-hotel extraction latency for the current field profile"""
+        count = len(self.timings)
+        total = sum(self.timings)
+        return {
+            'fields': sorted(self.fields),
+            'hotels': count,
+            'total_seconds': round(total, 3),
+            'avg_seconds_per_hotel': round(total / count, 3) if count else 0.0,
+            'max_seconds_per_hotel': round(max(self.timings), 3) if count else 0.0
+        }
+
     def format_output(self):
         """Format the scraped data into the desired structure"""
         formatted_data = {
             "city": self.city,
             "hotels": self.hotels_data,
+            "price_events": self.price_events,
             "pagination": {
                 "current_page": 1,
                 "total_pages": 1
@@ -529,7 +654,9 @@ class KayakHotelScraper:
             "metadata": {
                 "scraping_date": datetime.now().strftime('%Y-%m-%d'),
                 "scraping_time": datetime.now().strftime('%H:%M'),
-                "source_url": self.base_url
+                "source_url": self.base_url,
+                "timing": self.timing_summary(),
+                "resources": self.monitor.summary()
             }
         }
         self.hotels_data = formatted_data
@@ -542,6 +669,11 @@ class KayakHotelScraper:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(self.hotels_data, f, ensure_ascii=False, indent=2)
                 self.logger.info(f"Data saved successfully to {filepath}")
+
+            if not self.shared_state:
+                self.amenity_vocab.save(AMENITY_VOCAB_FILE)
+                if self.change_detector:
+                    self.change_detector.save(PRICE_STATE_FILE)
             
         except Exception as e:
             self.logger.error(f"Error saving results: {str(e)}")
@@ -549,7 +681,12 @@ class KayakHotelScraper:
     def close(self):
         if self.driver:
             try:
-                self.driver.quit()
+                if self.broker:
+                    self.broker.release(self.driver)
+                else:
+                    self.driver.quit()
                 self.logger.info("WebDriver closed successfully")
             except Exception as e:
-                self.logger.error(f"Error closing WebDriver: {str(e)}")
\ No newline at end of file
+                self.logger.error(f"Error closing WebDriver: {str(e)}")
+            finally:
+                self.driver = None
\ No newline at end of file
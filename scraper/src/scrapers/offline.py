@@ -0,0 +1,246 @@
+"""Offline re-extraction of archived Kayak page snapshots.
+
+Runs the same selectors as KayakHotelScraper against stored page sources
+with BeautifulSoup, spread over a process pool, so selector fixes can be
+backfilled over past runs without re-crawling.
+"""
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from src.config.settings import AMENITY_VOCAB_FILE, DATA_DIR, SNAPSHOT_DIR
+from src.core.archive import SnapshotArchive, read_snapshot
+from src.utils.amenities import AmenityVocabulary
+from src.utils.images import ImageCollector
+from src.utils.prices import parse_price
+from src.utils.selectors import *
+
+BED_WORDS = ['bed', 'twin', 'double', 'queen', 'king']
+
+
+def _text(elem):
+    return elem.get_text(' ', strip=True) if elem else ''
+
+
+def parse_search_page(html, base_url=None):
+    """Extract hotel cards (basic info and images) from a search page source.
+
+    Card links are relative in the page source; pass the page URL as
+    ``base_url`` to resolve them into the absolute detail URLs the live
+    scraper records.
+    """
+    soup = BeautifulSoup(html, 'lxml')
+    hotels = []
+    for card in soup.select(HOTEL_CARD):
+        name_elem = card.select_one(HOTEL_NAME)
+        if not name_elem or not name_elem.get('href'):
+            continue
+        info = {
+            'hotel_name': _text(name_elem),
+            'detail_url': urljoin(base_url or '', name_elem.get('href')),
+            'location': _text(card.select_one(HOTEL_LOCATION)) or None,
+        }
+
+        try:
+            info['review_scores'] = {
+                'rating': float(_text(card.select_one(HOTEL_RATING))),
+                'count': int(''.join(filter(str.isdigit, _text(card.select_one(HOTEL_REVIEWS)))))
+            }
+        except ValueError:
+            info['review_scores'] = {'rating': None, 'count': None}
+
+        info['price'] = _text(card.select_one(PRICE_AMOUNT)) or None
+        parsed_price = parse_price(info['price'])
+        info['price_amount'] = parsed_price['amount'] if parsed_price else None
+        info['price_currency'] = parsed_price['currency'] if parsed_price else None
+
+        collector = ImageCollector()
+        photo_wrap = card.select_one(f"{SEARCH_PHOTO_CONTAINER} {SEARCH_PHOTO_WRAP}")
+        if photo_wrap:
+            alt = None
+            img_elem = photo_wrap.select_one('img.e9fk-photo')
+            if img_elem:
+                alt = img_elem.get('alt')
+                collector.add(img_elem.get('src'), alt=alt, type='main')
+                collector.add_srcset(img_elem.get('srcset'), alt=alt, type='main')
+            for source in photo_wrap.select('picture source'):
+                collector.add_srcset(source.get('srcset'), alt=alt, type='main')
+        info['images'] = collector.images()
+        hotels.append(info)
+    return hotels
+
+
+def parse_detail_page(html):
+    """Extract images, rooms and raw amenities from a detail page source"""
+    soup = BeautifulSoup(html, 'lxml')
+    details = {}
+
+    collector = ImageCollector()
+    for item in soup.select(f"{DETAIL_PHOTO_CONTAINER} {DETAIL_PHOTO_ITEM}"):
+        img_elem = item.select_one(DETAIL_PHOTO)
+        if img_elem:
+            alt = img_elem.get('alt')
+            collector.add(img_elem.get('src'), alt=alt, type='detail')
+            collector.add_srcset(img_elem.get('srcset'), alt=alt, type='detail')
+    if len(collector):
+        details['images'] = collector.images()
+
+    rooms = []
+    for room_elem in soup.select(ROOM_SECTION):
+        room_info = {
+            'room_type': _text(room_elem.select_one(ROOM_TYPE)) or None,
+            'price': None,
+            'currency': None,
+            'bed_configuration': None,
+            'cancellation_policy': None,
+            'board_type': None,
+            'special_conditions': []
+        }
+        for selector in ROOM_PRICE_SELECTORS:
+            price = parse_price(_text(room_elem.select_one(selector)))
+            if price:
+                room_info['price'] = price['amount']
+                room_info['currency'] = price['currency']
+                break
+        for elem in room_elem.select(BED_CONFIG):
+            text = _text(elem)
+            if any(word in text.lower() for word in BED_WORDS):
+                room_info['bed_configuration'] = text
+                break
+        for elem in room_elem.select(SPECIAL_CONDITIONS):
+            text = _text(elem)
+            if 'cancellation' in text.lower():
+                room_info['cancellation_policy'] = text
+            elif 'breakfast' in text.lower():
+                room_info['board_type'] = text
+            elif text:
+                room_info['special_conditions'].append(text)
+        if any(v for v in room_info.values() if v):
+            rooms.append(room_info)
+    if rooms:
+        details['rooms'] = rooms
+
+    amenities = []
+    seen = set()
+    for elem in soup.select(f"{AMENITY_ITEM}, {AMENITY_EXPANDED_ITEM}"):
+        amenity = _text(elem)
+        if amenity and amenity not in seen:
+            seen.add(amenity)
+            amenities.append(amenity)
+    if amenities:
+        details['amenities'] = amenities
+    return details
+
+
+def _extract_entry(args):
+    """Worker: parse one archived snapshot"""
+    root, entry = args
+    try:
+        html = read_snapshot(os.path.join(root, entry['path']))
+        if entry['kind'] == 'search':
+            return entry, parse_search_page(html, entry['url']), None
+        return entry, parse_detail_page(html), None
+    except Exception as e:
+        return entry, None, str(e)
+
+
+def reextract_archive(archive, workers=None, since=None, until=None, vocab=None):
+    """Re-run the extractors over an archive and rebuild scrape results.
+
+    Returns one result per archived search page, in the same structure as
+    KayakHotelScraper.format_output. Each hotel is joined with the latest
+    detail snapshot of its URL taken for the same search context.
+    """
+    entries = list(archive.entries(since=since, until=until))
+    searches = []
+    details = {}  # (context key, url) -> (timestamp, details)
+    errors = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [(archive.root, entry) for entry in entries]
+        chunksize = max(1, len(jobs) // ((workers or os.cpu_count() or 1) * 4))
+        for entry, data, error in pool.map(_extract_entry, jobs, chunksize=chunksize):
+            if error:
+                errors += 1
+                continue
+            context_key = json.dumps(entry.get('context', {}), sort_keys=True)
+            if entry['kind'] == 'search':
+                searches.append((entry, data))
+            else:
+                key = (context_key, entry['url'])
+                if key not in details or details[key][0] < entry['timestamp']:
+                    details[key] = (entry['timestamp'], data)
+
+    vocab = vocab or AmenityVocabulary()
+    results = []
+    for entry, hotels in sorted(searches, key=lambda item: item[0]['timestamp']):
+        context = entry.get('context', {})
+        context_key = json.dumps(context, sort_keys=True)
+        for hotel in hotels:
+            found = details.get((context_key, hotel['detail_url']))
+            if not found:
+                continue
+            hotel_details = dict(found[1])
+            if hotel_details.get('images'):
+                collector = ImageCollector()
+                for image in hotel['images'] + hotel_details.pop('images'):
+                    collector.add(image['url'], alt=image['alt'], type=image['type'],
+                                  width=image.get('width'))
+                hotel['images'] = collector.images()
+            if hotel_details.get('amenities'):
+                # These hotels were counted when they were scraped live
+                normalized = vocab.normalize(hotel_details['amenities'], count=False)
+                hotel_details['amenity_keys'] = normalized['canonical']
+                hotel_details['amenity_categories'] = normalized['categories']
+                hotel_details['amenity_bitset'] = normalized['bitset']
+            hotel.update(hotel_details)
+
+        timestamp = datetime.fromisoformat(entry['timestamp'])
+        results.append({
+            "city": context.get('city'),
+            "hotels": hotels,
+            "pagination": {
+                "current_page": 1,
+                "total_pages": 1
+            },
+            "metadata": {
+                "scraping_date": timestamp.strftime('%Y-%m-%d'),
+                "scraping_time": timestamp.strftime('%H:%M'),
+                "source_url": entry['url'],
+                "check_in": context.get('check_in'),
+                "check_out": context.get('check_out'),
+                "reextracted_at": datetime.now().isoformat(timespec='seconds'),
+                "snapshot_errors": errors
+            }
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Re-extract archived Kayak snapshots')
+    parser.add_argument('--archive', default=SNAPSHOT_DIR, help='Snapshot archive directory')
+    parser.add_argument('--output', default=os.path.join(DATA_DIR, 'reextracted.json'))
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes')
+    parser.add_argument('--since', help='Only snapshots at or after this ISO timestamp')
+    parser.add_argument('--until', help='Only snapshots at or before this ISO timestamp')
+    args = parser.parse_args(argv)
+
+    vocab = AmenityVocabulary.load(AMENITY_VOCAB_FILE)
+    results = reextract_archive(SnapshotArchive(args.archive), workers=args.workers,
+                                since=args.since, until=args.until, vocab=vocab)
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    vocab.save(AMENITY_VOCAB_FILE)
+    print(f"Re-extracted {len(results)} search snapshots to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
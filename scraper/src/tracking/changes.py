@@ -0,0 +1,227 @@
+"""Incremental price change detection over newly scraped hotels."""
+import json
+import os
+import re
+from datetime import datetime
+
+# Event types emitted by PriceChangeDetector
+NEW_HOTEL = 'new_hotel'
+NEW_ROOM = 'new_room'
+PRICE_DROP = 'price_drop'
+PRICE_RISE = 'price_rise'
+NEW_LOW = 'new_low'
+SOLD_OUT = 'sold_out'
+BACK_IN_STOCK = 'back_in_stock'
+
+_HOTEL_ID = re.compile(r'-h(\d+)-')
+_KEY_SEP = '|'
+# Key name for the search-card price, kept apart from room types
+CARD_PRICE = '*card'
+
+
+def hotel_key(hotel):
+    """Stable key for a hotel: Kayak's hotel id if present, else its name"""
+    match = _HOTEL_ID.search(hotel.get('detail_url') or '')
+    if match:
+        return f"h{match.group(1)}"
+    return (hotel.get('hotel_name') or '').strip().lower()
+
+
+def _date(value):
+    if value is None:
+        return ''
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+class PriceChangeDetector:
+    """Compare each new observation against the latest known price.
+
+    State is one entry per (hotel, room type, check-in, check-out) key plus a
+    per-stay index of the room types last seen, so observing a hotel only
+    touches that hotel's keys and a run costs O(new observations) no matter
+    how much history has been recorded.
+    """
+
+    def __init__(self, drop_threshold=0.1, rise_threshold=None):
+        self.drop_threshold = drop_threshold
+        self.rise_threshold = rise_threshold
+        self.latest = {}  # key -> {'price', 'currency', 'low', 'available', 'seen_at'}
+        self.rooms = {}   # stay key -> sorted list of room types last seen
+
+    @staticmethod
+    def make_key(hotel_id, room_type, check_in, check_out):
+        return _KEY_SEP.join((hotel_id, room_type or '', _date(check_in), _date(check_out)))
+
+    def _event(self, type, hotel, room_type, check_in, check_out, seen_at, **fields):
+        event = {
+            'type': type,
+            'hotel_name': hotel.get('hotel_name'),
+            'detail_url': hotel.get('detail_url'),
+            'room_type': room_type or None,
+            'check_in': _date(check_in),
+            'check_out': _date(check_out),
+            'observed_at': seen_at,
+        }
+        event.update(fields)
+        return event
+
+    def observe(self, hotel, check_in, check_out, observed_at=None):
+        """Record one scraped hotel and return the events it triggers.
+
+        The search-card price and each room type are tracked under separate
+        keys. A field missing from the hotel dict (not extracted in this
+        run) is left alone; a field present with no price counts as sold out.
+        """
+        seen_at = observed_at or datetime.now().isoformat(timespec='seconds')
+        hotel_id = hotel_key(hotel)
+        if not hotel_id:
+            return []
+
+        events = []
+        stay = self.make_key(hotel_id, None, check_in, check_out)
+        previous_rooms = self.rooms.get(stay)
+        if previous_rooms is None:
+            events.append(self._event(NEW_HOTEL, hotel, None, check_in, check_out, seen_at))
+            previous_rooms = []
+
+        context = (hotel, hotel_id, check_in, check_out, seen_at)
+        if 'price_amount' in hotel:
+            events.extend(self._observe_price(context, CARD_PRICE, None,
+                                              hotel['price_amount'], hotel.get('price_currency')))
+
+        rooms = hotel.get('rooms') or []
+        current_rooms = set()
+        for room in rooms:
+            room_type = room.get('room_type') or ''
+            current_rooms.add(room_type)
+            events.extend(self._observe_price(context, room_type, room_type, room.get('price'),
+                                              room.get('currency'), new_room=bool(previous_rooms)))
+
+        # Room types offered last time but missing now are sold out; skip
+        # this when the detail page yielded no rooms at all
+        for room_type in previous_rooms if rooms else ():
+            if room_type in current_rooms:
+                continue
+            state = self.latest.get(self.make_key(hotel_id, room_type, check_in, check_out))
+            if state and state['available']:
+                events.append(self._event(SOLD_OUT, hotel, room_type, check_in, check_out,
+                                          seen_at, old_price=state['price']))
+                state['available'] = False
+                state['seen_at'] = seen_at
+
+        self.rooms[stay] = sorted(current_rooms | set(previous_rooms))
+        return events
+
+    def _observe_price(self, context, key_name, room_type, amount, currency, new_room=False):
+        """Compare one price with its stored state and return its events"""
+        hotel, hotel_id, check_in, check_out, seen_at = context
+        key = self.make_key(hotel_id, key_name, check_in, check_out)
+        state = self.latest.get(key)
+        events = []
+
+        def event(type, **fields):
+            events.append(self._event(type, hotel, room_type, check_in, check_out,
+                                      seen_at, **fields))
+
+        if amount is None:
+            if state and state['available']:
+                event(SOLD_OUT, old_price=state['price'])
+                state['available'] = False
+                state['seen_at'] = seen_at
+            return events
+
+        if state is None:
+            if new_room:
+                event(NEW_ROOM, new_price=amount, currency=currency)
+            self.latest[key] = {'price': amount, 'currency': currency, 'low': amount,
+                                'available': True, 'seen_at': seen_at}
+            return events
+
+        old = state['price']
+        same_currency = not currency or not state['currency'] or currency == state['currency']
+        if not state['available']:
+            event(BACK_IN_STOCK, new_price=amount, currency=currency)
+        elif old and same_currency:
+            change = (amount - old) / old
+            if self.drop_threshold is not None and -change >= self.drop_threshold:
+                event(PRICE_DROP, old_price=old, new_price=amount, currency=currency,
+                      change_pct=round(change * 100, 2))
+            elif self.rise_threshold is not None and change >= self.rise_threshold:
+                event(PRICE_RISE, old_price=old, new_price=amount, currency=currency,
+                      change_pct=round(change * 100, 2))
+
+        if not same_currency:
+            # Lows in another currency are not comparable; start over
+            state['low'] = amount
+        elif amount < state['low']:
+            event(NEW_LOW, old_low=state['low'], new_price=amount, currency=currency)
+            state['low'] = amount
+
+        state.update(price=amount, currency=currency or state['currency'],
+                     available=True, seen_at=seen_at)
+        return events
+
+    def process(self, hotels, check_in, check_out, observed_at=None):
+        """Yield events for a stream of hotels as they are observed"""
+        for hotel in hotels:
+            yield from self.observe(hotel, check_in, check_out, observed_at)
+
+    def to_dict(self):
+        return {'latest': self.latest, 'rooms': self.rooms}
+
+    @classmethod
+    def load(cls, filepath, **kwargs):
+        """Load detector state from disk, or start with empty state"""
+        detector = cls(**kwargs)
+        if os.path.exists(filepath):
+            with open(filepath, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            detector.latest = data.get('latest', {})
+            detector.rooms = data.get('rooms', {})
+        return detector
+
+    def save(self, filepath):
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(tmp_path, filepath)
+
+
+def benchmark(hotels=10_000, rooms=4, runs=5, seed=0):
+    """Measure observations per second over several simulated runs"""
+    import random
+    import time
+
+    rng = random.Random(seed)
+    detector = PriceChangeDetector()
+    base = {h: [rng.uniform(50, 500) for _ in range(rooms)] for h in range(hotels)}
+    observations = 0
+    events = 0
+
+    start = time.perf_counter()
+    for run in range(runs):
+        for h, prices in base.items():
+            hotel = {
+                'hotel_name': f"Hotel {h}",
+                'detail_url': f"https://www.kayak.com/hotels/Hotel-{h}-h{h}-details",
+                'rooms': [
+                    {'room_type': f"Room {r}",
+                     'price': None if rng.random() < 0.02 else round(p * rng.uniform(0.8, 1.1), 2),
+                     'currency': 'USD'}
+                    for r, p in enumerate(prices)
+                ],
+            }
+            events += len(detector.observe(hotel, '2025-01-10', '2025-01-14', f"run-{run}"))
+            observations += rooms
+    elapsed = time.perf_counter() - start
+    return {'observations': observations, 'events': events, 'seconds': elapsed,
+            'observations_per_sec': observations / elapsed if elapsed else float('inf')}
+
+
+if __name__ == '__main__':
+    print(benchmark())
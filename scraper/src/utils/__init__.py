@@ -1,17 +1,20 @@
 # src/utils/__init__.py
-from .retry import (
-    find_element_with_retry,
-    wait_for_element,
-    wait_for_elements,
-    wait_for_page_load,
-    scroll_into_view
-)
 from .selectors import *
 
-__all__ = [
+# The retry helpers import Selenium, so they are loaded on first access
+_RETRY_HELPERS = (
     'find_element_with_retry',
     'wait_for_element',
     'wait_for_elements',
     'wait_for_page_load',
     'scroll_into_view'
-]
\ No newline at end of file
+)
+
+__all__ = list(_RETRY_HELPERS)
+
+
+def __getattr__(name):
+    if name in _RETRY_HELPERS:
+        from . import retry
+        return getattr(retry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,211 @@
+"""Amenity normalization: canonical vocabulary, synonyms, categories and bitsets."""
+import json
+import os
+import re
+
+from .selectors import PROPERTY_FEATURES, AMENITY_SECTIONS
+
+# Canonical amenities and the raw labels Kayak uses for them.
+# The first entries mirror PROPERTY_FEATURES so the key features always
+# occupy the lowest bits of the bitset.
+AMENITY_SYNONYMS = {
+    'wifi': ['wi-fi', 'wifi', 'free wi-fi', 'free wifi', 'wireless internet',
+             'internet access', 'free internet', 'wi-fi in public areas'],
+    'parking': ['parking', 'free parking', 'on-site parking', 'valet parking',
+                'self parking', 'parking available', 'paid parking'],
+    'breakfast': ['breakfast', 'free breakfast', 'breakfast available',
+                  'continental breakfast', 'buffet breakfast', 'breakfast included'],
+    'pool': ['pool', 'swimming pool', 'indoor pool', 'outdoor pool', 'heated pool'],
+    'spa': ['spa', 'full-service spa', 'spa services', 'sauna', 'hot tub'],
+    'fitness': ['fitness', 'fitness center', 'gym', 'fitness centre', 'fitness facilities'],
+    'restaurant': ['restaurant', 'on-site restaurant', 'restaurants'],
+    'bar': ['bar', 'bar/lounge', 'lounge', 'poolside bar'],
+    'business': ['business center', 'business centre', 'meeting rooms',
+                 'conference facilities', 'business services'],
+    'air_conditioning': ['air conditioning', 'air-conditioned', 'a/c'],
+    'kitchen': ['kitchen', 'kitchenette', 'full kitchen', 'microwave', 'refrigerator'],
+    'pets': ['pet friendly', 'pets allowed', 'pet-friendly'],
+    'airport_shuttle': ['airport shuttle', 'airport transfer', 'free airport shuttle'],
+    'front_desk_24h': ['24-hour front desk', '24 hour front desk', '24/7 front desk'],
+    'laundry': ['laundry', 'laundry facilities', 'dry cleaning', 'laundry service'],
+    'accessible': ['wheelchair accessible', 'accessible rooms', 'elevator'],
+    'non_smoking': ['non-smoking', 'non-smoking rooms', 'smoke-free property'],
+    'room_service': ['room service', '24-hour room service'],
+    'tv': ['tv', 'flat-screen tv', 'cable tv', 'satellite tv'],
+    'desk': ['desk', 'work desk', 'workspace'],
+}
+
+# Category for each canonical amenity, using the AMENITY_SECTIONS keys
+AMENITY_CATEGORIES = {
+    'wifi': 'basics',
+    'parking': 'transportation',
+    'breakfast': 'dining',
+    'pool': 'outdoor',
+    'spa': 'services',
+    'fitness': 'activities',
+    'restaurant': 'dining',
+    'bar': 'dining',
+    'business': 'workspace',
+    'air_conditioning': 'basics',
+    'kitchen': 'kitchen',
+    'pets': 'general',
+    'airport_shuttle': 'transportation',
+    'front_desk_24h': 'services',
+    'laundry': 'services',
+    'accessible': 'accessibility',
+    'non_smoking': 'general',
+    'room_service': 'services',
+    'tv': 'media',
+    'desk': 'workspace',
+}
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_label(label):
+    """Lowercase and collapse whitespace in a raw amenity label"""
+    return _WHITESPACE.sub(' ', label.strip().lower())
+
+
+def slugify(label):
+    """Turn an unknown amenity label into a canonical-style key"""
+    return re.sub(r'[^a-z0-9]+', '_', normalize_label(label)).strip('_')
+
+
+class AmenityVocabulary:
+    """Global amenity vocabulary that assigns every canonical amenity a stable bit.
+
+    Known amenities come from AMENITY_SYNONYMS; unseen labels are interned as
+    new canonical entries so the vocabulary grows across runs. Bits are never
+    reassigned, so bitsets stored from earlier runs stay valid.
+    """
+
+    def __init__(self, names=None, categories=None, synonyms=None):
+        self.bits = {}        # canonical name -> bit index
+        self.names = []       # bit index -> canonical name
+        self.categories = {}  # canonical name -> category
+        self.synonyms = {}    # normalized label -> canonical name
+        self.counts = {}      # canonical name -> times seen
+
+        # Stored names are replayed first, in bit order, so neither they nor
+        # the built-ins move when the synonym table gains entries
+        categories = categories or {}
+        for name in names or []:
+            self.intern(name, categories.get(name))
+        self.synonyms.update(synonyms or {})
+
+        for name in PROPERTY_FEATURES:
+            self.intern(name)
+        for name, labels in AMENITY_SYNONYMS.items():
+            self.intern(name)
+            for label in labels:
+                self.synonyms[normalize_label(label)] = name
+
+    def intern(self, name, category=None):
+        """Return the bit index for a canonical name, adding it if needed"""
+        bit = self.bits.get(name)
+        if bit is None:
+            bit = len(self.names)
+            self.bits[name] = bit
+            self.names.append(name)
+            self.categories[name] = category or AMENITY_CATEGORIES.get(name, 'general')
+        return bit
+
+    def canonicalize(self, label):
+        """Map a raw amenity label to its canonical name"""
+        key = normalize_label(label)
+        name = self.synonyms.get(key)
+        if name is None:
+            name = slugify(label)
+            if not name:
+                return None
+            self.synonyms[key] = name
+        return name
+
+    def normalize(self, labels, category=None, count=True):
+        """Normalize raw labels into canonical amenities and a bitset.
+
+        Returns a dict with the de-duplicated canonical names (in first-seen
+        order), the categories they fall into and the integer bitset. Pass
+        ``count=False`` when re-processing hotels that were already counted.
+        """
+        if category is not None and category not in AMENITY_SECTIONS:
+            category = None
+
+        seen = set()
+        names = []
+        bitset = 0
+        for label in labels:
+            if not label:
+                continue
+            name = self.canonicalize(label)
+            if name is None or name in seen:
+                continue
+            seen.add(name)
+            names.append(name)
+            bitset |= 1 << self.intern(name, category)
+            if count:
+                self.counts[name] = self.counts.get(name, 0) + 1
+
+        categories = sorted({self.categories[name] for name in names})
+        return {
+            'canonical': names,
+            'categories': categories,
+            'bitset': bitset,
+        }
+
+    def mask(self, *names):
+        """Build a bitmask for a set of canonical amenity names"""
+        mask = 0
+        for name in names:
+            bit = self.bits.get(name)
+            if bit is None:
+                raise KeyError(f"Unknown amenity: {name}")
+            mask |= 1 << bit
+        return mask
+
+    def decode(self, bitset):
+        """Return the canonical names encoded in a bitset"""
+        return [name for bit, name in enumerate(self.names) if bitset >> bit & 1]
+
+    @staticmethod
+    def has_all(bitset, mask):
+        """Constant-time check that a hotel bitset contains every bit in mask"""
+        return bitset & mask == mask
+
+    def filter_hotels(self, hotels, *names):
+        """Yield hotels whose amenity bitset contains all requested amenities"""
+        mask = self.mask(*names)
+        for hotel in hotels:
+            if hotel.get('amenity_bitset', 0) & mask == mask:
+                yield hotel
+
+    def to_dict(self):
+        return {
+            'names': self.names,
+            'categories': self.categories,
+            'synonyms': self.synonyms,
+            'counts': self.counts,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        vocab = cls(data.get('names'), data.get('categories'), data.get('synonyms'))
+        for name, count in data.get('counts', {}).items():
+            vocab.counts[name] = vocab.counts.get(name, 0) + count
+        return vocab
+
+    @classmethod
+    def load(cls, filepath):
+        """Load a vocabulary from disk, or start a fresh one"""
+        if not os.path.exists(filepath):
+            return cls()
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, filepath):
+        directory = os.path.dirname(filepath)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
@@ -0,0 +1,186 @@
+"""Image URL canonicalization, srcset parsing and deduplication."""
+import asyncio
+import hashlib
+import os
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters Kayak's image resizer uses to produce size variants
+RESIZE_PARAMS = {'width', 'height', 'w', 'h', 'crop', 'quality', 'q',
+                 'outputtype', 'format', 'fit', 'dpr', 'xhint', 'yhint'}
+
+# Resized variants are served under /rimg/ in front of the original asset path
+_RESIZE_PREFIX = re.compile(r'^/rimg/')
+_DESCRIPTOR = re.compile(r'^(\d+(?:\.\d+)?)([wx])$')
+
+
+def parse_srcset(srcset):
+    """Parse a srcset string into a list of (url, width) tuples.
+
+    Width is None for density (``2x``) or missing descriptors.
+    """
+    entries = []
+    if not srcset:
+        return entries
+    for candidate in srcset.split(','):
+        parts = candidate.strip().split()
+        if not parts:
+            continue
+        url = parts[0]
+        width = None
+        if len(parts) > 1:
+            match = _DESCRIPTOR.match(parts[1])
+            if match and match.group(2) == 'w':
+                width = int(float(match.group(1)))
+        entries.append((url, width))
+    return entries
+
+
+def url_width(url):
+    """Read the requested width from a resize URL, if present"""
+    for key, value in parse_qsl(urlsplit(url).query):
+        if key.lower() in ('width', 'w') and value.isdigit():
+            return int(value)
+    return None
+
+
+def canonical_url(url):
+    """Strip resize parameters and fragments from an image URL"""
+    parts = urlsplit(url.strip())
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k.lower() not in RESIZE_PARAMS]
+    return urlunsplit((parts.scheme or 'https', parts.netloc.lower(), parts.path,
+                       urlencode(query), ''))
+
+
+def canonical_asset_id(url):
+    """Map any size variant of a Kayak image URL to one asset ID.
+
+    The ID is the asset path without the resizer prefix and resize
+    parameters, so variants served from different CDN hosts collapse too.
+    """
+    parts = urlsplit(canonical_url(url))
+    path = _RESIZE_PREFIX.sub('/', parts.path)
+    asset = path.lstrip('/')
+    if parts.query:
+        asset = f"{asset}?{parts.query}"
+    return asset
+
+
+class ImageCollector:
+    """Collect image variants and keep one chosen variant per asset.
+
+    By default the widest variant wins; pass ``target_width`` to prefer the
+    smallest variant at least that wide instead. The collector can be shared
+    between the search card and the detail page so the same photo is only
+    stored once per hotel.
+    """
+
+    def __init__(self, target_width=None):
+        self.target_width = target_width
+        self.assets = {}  # asset id -> image dict
+
+    def __len__(self):
+        return len(self.assets)
+
+    def __contains__(self, url):
+        return canonical_asset_id(url) in self.assets
+
+    def _better(self, new_width, old_width):
+        if old_width is None:
+            return new_width is not None
+        if new_width is None:
+            return False
+        if self.target_width is None:
+            return new_width > old_width
+        # Prefer the smallest width that still meets the target
+        if old_width < self.target_width:
+            return new_width > old_width
+        return self.target_width <= new_width < old_width
+
+    def add(self, url, alt=None, type='main', width=None):
+        """Add one image URL; returns True if it introduced a new asset"""
+        if not url or url.startswith('data:'):
+            return False
+        if width is None:
+            width = url_width(url)
+        asset_id = canonical_asset_id(url)
+        image = self.assets.get(asset_id)
+        if image is None:
+            self.assets[asset_id] = {
+                'url': url,
+                'alt': alt,
+                'type': type,
+                'asset_id': asset_id,
+                'width': width,
+            }
+            return True
+
+        if self._better(width, image['width']):
+            image['url'] = url
+            image['width'] = width
+        if alt and not image['alt']:
+            image['alt'] = alt
+        return False
+
+    def add_srcset(self, srcset, alt=None, type='main'):
+        """Add every candidate of a srcset; returns the number of new assets"""
+        added = 0
+        for url, width in parse_srcset(srcset):
+            added += self.add(url, alt=alt, type=type, width=width)
+        return added
+
+    def images(self):
+        """Return the chosen variant of each asset, in first-seen order"""
+        return list(self.assets.values())
+
+
+def _asset_path(store_dir, digest, url):
+    ext = os.path.splitext(urlsplit(url).path)[1].lower()
+    if ext not in ('.jpg', '.jpeg', '.png', '.webp', '.gif', '.avif'):
+        ext = ''
+    return os.path.join(store_dir, digest[:2], f"{digest}{ext}")
+
+
+async def _fetch_one(session, semaphore, image, store_dir, known):
+    async with semaphore:
+        try:
+            async with session.get(image['url']) as response:
+                if response.status != 200:
+                    return None
+                body = await response.read()
+        except Exception:
+            return None
+
+    digest = hashlib.sha256(body).hexdigest()
+    path = _asset_path(store_dir, digest, image['url'])
+    if digest not in known and not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    known.add(digest)
+    image['sha256'] = digest
+    image['local_path'] = path
+    return digest
+
+
+async def fetch_images(images, store_dir, concurrency=8, timeout=30):
+    """Download images into a content-addressed store under ``store_dir``.
+
+    Files are named by the SHA-256 of their bytes, so identical photos
+    served under different asset IDs are stored once. Each image dict gets
+    ``sha256`` and ``local_path`` keys on success. Returns the set of
+    digests fetched.
+    """
+    import aiohttp
+
+    semaphore = asyncio.Semaphore(concurrency)
+    known = set()
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(timeout=client_timeout) as session:
+        await asyncio.gather(*(
+            _fetch_one(session, semaphore, image, store_dir, known)
+            for image in images
+        ))
+    return known
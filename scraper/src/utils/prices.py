@@ -0,0 +1,250 @@
+"""Price parsing: locale separators, currencies and price labels."""
+import re
+
+# Currency symbols, longest first so "C$" wins over "$"
+CURRENCY_SYMBOLS = {
+    'US$': 'USD',
+    'CA$': 'CAD',
+    'C$': 'CAD',
+    'A$': 'AUD',
+    'AU$': 'AUD',
+    'NZ$': 'NZD',
+    'MX$': 'MXN',
+    'R$': 'BRL',
+    'HK$': 'HKD',
+    'S$': 'SGD',
+    '$': 'USD',
+    '€': 'EUR',
+    '£': 'GBP',
+    '¥': 'JPY',
+    '₹': 'INR',
+    '₩': 'KRW',
+    '₺': 'TRY',
+    '₽': 'RUB',
+    '₪': 'ILS',
+    '฿': 'THB',
+    'zł': 'PLN',
+    'kr': 'SEK',
+    'Fr.': 'CHF',
+}
+
+# Flags packed into a single byte per price
+PER_NIGHT = 1
+TOTAL = 2
+TAXES_INCLUDED = 4
+TAXES_EXCLUDED = 8
+
+_SYMBOL_PATTERN = '|'.join(re.escape(s) for s in sorted(CURRENCY_SYMBOLS, key=len, reverse=True))
+_CURRENCY = re.compile(rf'\b([A-Z]{{3}})\b|({_SYMBOL_PATTERN})')
+_NUMBER = re.compile("\\d{1,3}(?:[.,\u00a0\u202f' ]\\d{3})+(?:[.,]\\d+)?|\\d+(?:[.,]\\d+)?")
+# Counts such as "2 nights" or "4 guests" that are not the price
+_COUNT_UNIT = re.compile(r'\s*(nights?|nts?\b|guests?|adults?|children|rooms?|people|persons?|beds?)\b',
+                         re.IGNORECASE)
+_PER_NIGHT = re.compile(r'(per|/|a|each)\s*night|nightly|/\s*nt\b', re.IGNORECASE)
+_TOTAL = re.compile(r'\btotal\b|for\s+\d+\s+nights?|entire\s+stay', re.IGNORECASE)
+_TAXES_INCLUDED = re.compile(r'(incl(uding|udes|\.)?|with)\s+(all\s+)?(taxes|tax|fees)|taxes\s+(and\s+fees\s+)?included', re.IGNORECASE)
+_TAXES_EXCLUDED = re.compile(r'(excl(uding|udes|\.)?|\+|plus)\s*(taxes|tax|fees)|before\s+tax', re.IGNORECASE)
+
+# ISO codes that are ordinary uppercase words in price labels
+_NOT_CURRENCIES = {'PER', 'AND', 'FOR', 'TAX', 'THE', 'NOW', 'NEW', 'OFF', 'ALL'}
+
+
+def parse_amount(number):
+    """Parse a numeric string using locale separators into a float.
+
+    The rightmost of ``.`` and ``,`` is the decimal separator when both
+    appear. A single separator followed by exactly three digits is treated
+    as a thousands separator, otherwise as a decimal point.
+    """
+    digits = re.sub("[\\s\u00a0\u202f']", '', number)
+    if not digits:
+        return None
+
+    last_dot = digits.rfind('.')
+    last_comma = digits.rfind(',')
+    if last_dot >= 0 and last_comma >= 0:
+        decimal = '.' if last_dot > last_comma else ','
+    elif last_dot >= 0 or last_comma >= 0:
+        sep = '.' if last_dot >= 0 else ','
+        head, _, tail = digits.rpartition(sep)
+        if digits.count(sep) > 1 or len(tail) == 3:
+            decimal = None
+        else:
+            decimal = sep
+    else:
+        decimal = None
+
+    if decimal is None:
+        cleaned = digits.replace('.', '').replace(',', '')
+    else:
+        thousands = ',' if decimal == '.' else '.'
+        cleaned = digits.replace(thousands, '').replace(decimal, '.')
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+def _find_currency(text):
+    """Return (ISO code, match span) of the first currency in text, or (None, None)"""
+    for match in _CURRENCY.finditer(text):
+        code, symbol = match.groups()
+        if code:
+            if code not in _NOT_CURRENCIES:
+                return code, match.span()
+        else:
+            return CURRENCY_SYMBOLS[symbol], match.span()
+    return None, None
+
+
+def parse_currency(text):
+    """Return the ISO currency code found in a price string, or None"""
+    return _find_currency(text)[0]
+
+
+def _find_amount(text, currency_span=None):
+    """Pick the number that is the price.
+
+    Numbers followed by a count unit ("2 nights", "4 guests") are skipped.
+    When a currency was found, the number closest to it wins.
+    """
+    candidates = [m for m in _NUMBER.finditer(text) if not _COUNT_UNIT.match(text, m.end())]
+    if not candidates:
+        return None
+    if currency_span is None:
+        return candidates[0]
+    start, end = currency_span
+
+    def distance(match):
+        if match.start() >= end:
+            return match.start() - end
+        return max(0, start - match.end())
+
+    return min(candidates, key=distance)
+
+
+def parse_flags(text):
+    """Return the label flags (per night, total, taxes) for a price string"""
+    flags = 0
+    if _PER_NIGHT.search(text):
+        flags |= PER_NIGHT
+    if _TOTAL.search(text):
+        flags |= TOTAL
+    if _TAXES_INCLUDED.search(text):
+        flags |= TAXES_INCLUDED
+    elif _TAXES_EXCLUDED.search(text):
+        flags |= TAXES_EXCLUDED
+    return flags
+
+
+def parse_price(text, default_currency=None):
+    """Parse a single price string.
+
+    Returns a dict with ``amount``, ``currency``, ``per_night``, ``total``,
+    ``taxes_included`` and ``flags``, or None if no amount is found.
+    """
+    if not text:
+        return None
+    text = str(text)
+    currency, currency_span = _find_currency(text)
+    match = _find_amount(text, currency_span)
+    if not match:
+        return None
+    amount = parse_amount(match.group())
+    if amount is None:
+        return None
+
+    flags = parse_flags(text)
+    taxes_included = None
+    if flags & TAXES_INCLUDED:
+        taxes_included = True
+    elif flags & TAXES_EXCLUDED:
+        taxes_included = False
+    return {
+        'amount': amount,
+        'currency': currency or default_currency,
+        'per_night': bool(flags & PER_NIGHT),
+        'total': bool(flags & TOTAL),
+        'taxes_included': taxes_included,
+        'flags': flags,
+    }
+
+
+def parse_prices(texts, default_currency=None):
+    """Parse a column of price strings into NumPy arrays.
+
+    Scraped price columns are highly repetitive, so each distinct string is
+    parsed once and the results are broadcast back with the inverse index.
+    Returns a dict of arrays: ``amount`` (float64, NaN when unparsable),
+    ``currency`` (``<U3``, empty when unknown) and ``flags`` (uint8 bitfield
+    of PER_NIGHT, TOTAL, TAXES_INCLUDED and TAXES_EXCLUDED).
+    """
+    import numpy as np
+
+    values = np.asarray(['' if t is None else str(t) for t in texts], dtype=str)
+    if values.size == 0:
+        return {
+            'amount': np.empty(0, dtype=np.float64),
+            'currency': np.empty(0, dtype='<U3'),
+            'flags': np.empty(0, dtype=np.uint8),
+        }
+
+    uniques, inverse = np.unique(values, return_inverse=True)
+    amounts = np.full(len(uniques), np.nan, dtype=np.float64)
+    currencies = np.full(len(uniques), default_currency or '', dtype='<U3')
+    flags = np.zeros(len(uniques), dtype=np.uint8)
+
+    for i, text in enumerate(uniques):
+        parsed = parse_price(text, default_currency)
+        if parsed is None:
+            continue
+        amounts[i] = parsed['amount']
+        currencies[i] = parsed['currency'] or ''
+        flags[i] = parsed['flags']
+
+    return {
+        'amount': amounts[inverse],
+        'currency': currencies[inverse],
+        'flags': flags[inverse],
+    }
+
+
+def benchmark(n=1_000_000, distinct=5_000, seed=0):
+    """Time parse_prices on ``n`` generated strings with ``distinct`` values.
+
+    Pass ``distinct=None`` to generate every string independently, which
+    measures the parser itself rather than the np.unique dedupe.
+    """
+    import random
+    import time
+    import numpy as np
+
+    rng = random.Random(seed)
+    templates = ['${:,.0f}', '€{:,.2f}', '{:,.2f} EUR', 'US${:,.0f} per night',
+                 '£{:,.0f} total', 'C${:,.2f} incl. taxes', '{:,.0f} ₹ /night']
+
+    def generate():
+        # Cents keep independently generated strings almost all distinct
+        text = rng.choice(templates).format(rng.randint(2000, 500000) / 100)
+        if rng.random() < 0.3:
+            # European formatting: swap the separators
+            text = text.replace(',', '\0').replace('.', ',').replace('\0', '.')
+        return text
+
+    if distinct is None:
+        texts = [generate() for _ in range(n)]
+    else:
+        pool = [generate() for _ in range(distinct)]
+        texts = [rng.choice(pool) for _ in range(n)]
+
+    start = time.perf_counter()
+    result = parse_prices(texts)
+    elapsed = time.perf_counter() - start
+    parsed = int(np.count_nonzero(~np.isnan(result['amount'])))
+    return {'strings': n, 'distinct': len(set(texts)), 'parsed': parsed, 'seconds': elapsed,
+            'strings_per_sec': n / elapsed if elapsed else float('inf')}
+
+
+if __name__ == '__main__':
+    print('repetitive column:', benchmark())
+    print('independent:      ', benchmark(distinct=None))
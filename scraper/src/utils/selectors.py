@@ -34,6 +34,13 @@ ROOM_SECTION = 'div.LK1E-groupedRoomType'
 ROOM_CARD = 'div.c5l3f'
 ROOM_TYPE = 'div.c_Hjx-group-header-title'
 ROOM_PRICE = 'span.C9NJ-amount'
+ROOM_PRICE_SELECTORS = [  # Tried in order of preference
+    'span.C9NJ-amount',
+    'div.C9NJ-amount',
+    'div.Ptt7-price',
+    'div.c1XBO',
+    'div[class*="price"]'
+]
 ROOM_PROVIDER = 'img.c2pAq-logo'
 ROOM_INFO = 'div.c_Hjx-header-details'
 ROOM_SIZE = 'span.c_Hjx-amenity:contains("sq ft")'
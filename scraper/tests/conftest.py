@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the ``src`` package importable when running pytest from scraper/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
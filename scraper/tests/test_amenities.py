@@ -0,0 +1,23 @@
+from src.utils import amenities
+from src.utils.amenities import AmenityVocabulary
+
+
+def test_normalize_dedupes_synonyms_into_bitset():
+    vocab = AmenityVocabulary()
+    result = vocab.normalize(['Free WiFi', 'Wi-Fi', 'Pool', 'Free parking'])
+
+    assert result['canonical'] == ['wifi', 'pool', 'parking']
+    assert vocab.has_all(result['bitset'], vocab.mask('wifi', 'pool', 'parking'))
+    assert not vocab.has_all(result['bitset'], vocab.mask('spa'))
+
+
+def test_learned_bits_survive_synonym_table_growth(monkeypatch):
+    vocab = AmenityVocabulary()
+    bitset = vocab.normalize(['Balcony'])['bitset']
+    stored = vocab.to_dict()
+
+    monkeypatch.setitem(amenities.AMENITY_SYNONYMS, 'minibar', ['minibar', 'mini bar'])
+    reloaded = AmenityVocabulary.from_dict(stored)
+
+    assert reloaded.decode(bitset) == ['balcony']
+    assert reloaded.bits == {**vocab.bits, 'minibar': len(vocab.names)}
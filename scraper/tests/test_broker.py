@@ -0,0 +1,143 @@
+import os
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+pytest.importorskip('selenium')
+
+import src.core.broker as broker_module
+from src.config.settings import CHROME_BINARY_PATH, CHROMEDRIVER_PATH
+from src.core.broker import BrowserNode, NoSessionAvailable, SessionBroker, launch_local_nodes
+
+
+class FakeDriver:
+    def __init__(self, url):
+        self.url = url
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def fresh_nodes(*capacities):
+    nodes = []
+    for i, capacity in enumerate(capacities):
+        node = BrowserNode(f'http://node{i}:4444', capacity)
+        node.last_check = time.monotonic()  # skip /status checks
+        nodes.append(node)
+    return nodes
+
+
+def make_broker(nodes, failing=()):
+    def factory(remote_url):
+        if remote_url in failing:
+            raise RuntimeError('session not created')
+        return FakeDriver(remote_url)
+    return SessionBroker(nodes, health_interval=3600, driver_factory=factory)
+
+
+def test_sessions_go_to_the_least_loaded_node():
+    a, b = fresh_nodes(2, 1)
+    broker = make_broker([a, b])
+    placed = [broker.acquire(timeout=1).url for _ in range(3)]
+    assert placed == [a.url, b.url, a.url]
+    assert (a.active, b.active) == (2, 1)
+
+
+def test_acquire_times_out_when_every_slot_is_taken():
+    broker = make_broker(fresh_nodes(1))
+    broker.acquire(timeout=1)
+    started = time.monotonic()
+    with pytest.raises(NoSessionAvailable):
+        broker.acquire(timeout=0.2)
+    assert time.monotonic() - started >= 0.2
+
+
+def test_release_frees_a_slot_for_a_waiting_acquire():
+    (node,) = fresh_nodes(1)
+    broker = make_broker([node])
+    first = broker.acquire(timeout=1)
+    acquired = []
+    waiter = threading.Thread(target=lambda: acquired.append(broker.acquire(timeout=5)))
+    waiter.start()
+    time.sleep(0.1)
+    assert not acquired
+
+    broker.release(first)
+    waiter.join(5)
+    assert first.quit_called
+    assert len(acquired) == 1 and node.active == 1
+
+
+def test_failing_node_is_marked_down():
+    bad, good = fresh_nodes(4, 1)
+    broker = make_broker([bad, good], failing={bad.url})
+    driver = broker.acquire(timeout=1)
+    assert driver.url == good.url
+    assert not bad.healthy and bad.failures == 1 and bad.active == 0
+
+
+def test_concurrent_refreshes_probe_each_node_once(monkeypatch):
+    probes = []
+
+    def slow_probe(node, timeout=5):
+        probes.append(node.url)
+        time.sleep(0.1)
+        return True
+
+    monkeypatch.setattr(BrowserNode, 'probe', slow_probe)
+    nodes = [BrowserNode(f'http://node{i}:4444') for i in range(3)]
+    broker = SessionBroker(nodes, health_interval=3600, driver_factory=FakeDriver)
+
+    threads = [threading.Thread(target=broker.refresh_health) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(probes) == sorted(node.url for node in nodes)
+    assert all(node.healthy and not node.checking for node in nodes)
+
+
+def test_launch_local_nodes_cleans_up_when_nodes_never_start(tmp_path, monkeypatch):
+    # A "chromedriver" that runs but never serves /status
+    script = tmp_path / 'chromedriver'
+    script.write_text(f'#!{sys.executable}\nimport time\ntime.sleep(60)\n')
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+    started = []
+    real_popen = subprocess.Popen
+
+    def popen(*args, **kwargs):
+        started.append(real_popen(*args, **kwargs))
+        return started[-1]
+
+    monkeypatch.setattr(broker_module.subprocess, 'Popen', popen)
+    with pytest.raises(RuntimeError, match='not ready'):
+        launch_local_nodes(2, base_port=19515, chromedriver=str(script), timeout=0.5)
+    assert len(started) == 2
+    assert all(process.poll() is not None for process in started)
+
+
+@pytest.mark.skipif(not (os.path.exists(CHROMEDRIVER_PATH) and os.path.exists(CHROME_BINARY_PATH)),
+                    reason='chromedriver and Chromium are not installed')
+def test_broker_spreads_sessions_over_local_chromedriver_nodes():
+    processes, nodes = launch_local_nodes(3, base_port=19615)
+    try:
+        broker = SessionBroker(nodes)
+        drivers = [broker.acquire(timeout=30) for _ in range(3)]
+        try:
+            assert [node.active for node in nodes] == [1, 1, 1]
+            for driver in drivers:
+                assert driver.execute_script('return 1 + 1') == 2
+        finally:
+            for driver in drivers:
+                broker.release(driver)
+        assert [node.active for node in nodes] == [0, 0, 0]
+    finally:
+        for process in processes:
+            process.terminate()
+            process.wait(timeout=10)
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import sys
+
+import pytest
+
+web = pytest.importorskip('aiohttp.web')
+
+from src.core.cdp import CDPBrowser, CDPConnection, CDPError
+
+
+async def devtools_handler(request):
+    """Stand-in for Chrome's browser websocket.
+
+    ``Echo`` replies with its params after an optional delay, ``Fail``
+    replies with an error, ``Emit`` sends an event before its reply,
+    ``Hang`` never replies and ``Close`` drops the connection.
+    """
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+
+    async def reply(message):
+        params = message.get('params', {})
+        method = message['method']
+        if method == 'Echo':
+            await asyncio.sleep(params.get('delay', 0))
+            await ws.send_str(json.dumps({'id': message['id'], 'result': params}))
+        elif method == 'Fail':
+            await ws.send_str(json.dumps({'id': message['id'],
+                                          'error': {'code': -32000, 'message': 'No target'}}))
+        elif method == 'Emit':
+            await ws.send_str(json.dumps({'method': params['event'],
+                                          'sessionId': message.get('sessionId'),
+                                          'params': {'value': params['value']}}))
+            await ws.send_str(json.dumps({'id': message['id'], 'result': {}}))
+        elif method == 'Close':
+            await ws.close()
+
+    tasks = []
+    async for msg in ws:
+        tasks.append(asyncio.ensure_future(reply(json.loads(msg.data))))
+    for task in tasks:
+        task.cancel()
+    return ws
+
+
+def run_with_connection(test):
+    async def main():
+        app = web.Application()
+        app.router.add_get('/devtools/browser', devtools_handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        connection = await CDPConnection.connect(f'ws://127.0.0.1:{port}/devtools/browser')
+        try:
+            return await test(connection)
+        finally:
+            await connection.close()
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_responses_are_routed_by_id():
+    async def test(connection):
+        # The first command is answered last
+        slow = connection.send('Echo', {'n': 1, 'delay': 0.2})
+        fast = connection.send('Echo', {'n': 2})
+        return await asyncio.gather(slow, fast)
+
+    slow, fast = run_with_connection(test)
+    assert slow['n'] == 1 and fast['n'] == 2
+
+
+def test_error_reply_raises():
+    async def test(connection):
+        with pytest.raises(CDPError, match='No target'):
+            await connection.send('Fail')
+        assert connection._pending == {}
+
+    run_with_connection(test)
+
+
+def test_events_are_routed_by_session_and_method():
+    async def test(connection):
+        other = connection.wait_for_event('Page.loadEventFired', 'session-b')
+        event = connection.wait_for_event('Page.loadEventFired', 'session-a')
+        await connection.send('Emit', {'event': 'Page.loadEventFired', 'value': 'a'},
+                              session_id='session-a')
+        assert await asyncio.wait_for(event, 1) == {'value': 'a'}
+        assert not other.done()
+        other.cancel()
+
+    run_with_connection(test)
+
+
+def test_timed_out_command_is_forgotten():
+    async def test(connection):
+        with pytest.raises(asyncio.TimeoutError):
+            await connection.send('Hang', timeout=0.1)
+        assert connection._pending == {}
+
+    run_with_connection(test)
+
+
+def test_pending_commands_fail_when_connection_closes():
+    async def test(connection):
+        hanging = asyncio.ensure_future(connection.send('Hang'))
+        event = connection.wait_for_event('Page.loadEventFired', 'session-a')
+        await asyncio.sleep(0.05)
+        await connection.ws.send_str(json.dumps({'id': 0, 'method': 'Close'}))
+        with pytest.raises(CDPError, match='Connection closed'):
+            await asyncio.wait_for(hanging, 1)
+        with pytest.raises(CDPError, match='Connection closed'):
+            await asyncio.wait_for(event, 1)
+
+    run_with_connection(test)
+
+
+class ClosedConnection:
+    async def send(self, method, params=None, session_id=None, timeout=None):
+        raise CDPError('Connection closed')
+
+    async def close(self):
+        pass
+
+
+def test_browser_drains_stderr_until_closed(tmp_path):
+    async def main():
+        # Writes far more than a pipe buffer holds before exiting
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, '-c', 'import sys; sys.stderr.write("log line\\n" * 100000)',
+            stderr=asyncio.subprocess.PIPE
+        )
+        task = asyncio.ensure_future(CDPBrowser._drain(process.stderr))
+        browser = CDPBrowser(process, ClosedConnection(), str(tmp_path / 'profile'), task)
+        await asyncio.wait_for(process.wait(), 10)
+        await browser.close()
+        await asyncio.sleep(0)
+        return browser.stderr_task.done()
+
+    assert asyncio.run(main())
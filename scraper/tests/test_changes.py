@@ -0,0 +1,54 @@
+from src.tracking.changes import (
+    NEW_HOTEL, NEW_LOW, NEW_ROOM, PRICE_DROP, SOLD_OUT, PriceChangeDetector,
+)
+
+URL = 'https://www.kayak.com/hotels/Test-Hotel,New-York-p1-h2503300-details/2025-01-10/2025-01-14/2adults'
+DATES = ('2025-01-10', '2025-01-14')
+
+
+def hotel(price=None, rooms=None, currency='USD'):
+    data = {'hotel_name': 'Test Hotel', 'detail_url': URL,
+            'price_amount': price, 'price_currency': currency}
+    if rooms is not None:
+        data['rooms'] = [{'room_type': name, 'price': amount, 'currency': currency}
+                         for name, amount in rooms]
+    return data
+
+
+def types(events):
+    return [event['type'] for event in events]
+
+
+def test_drop_and_new_low():
+    detector = PriceChangeDetector(drop_threshold=0.1)
+    assert types(detector.observe(hotel(200), *DATES)) == [NEW_HOTEL]
+    assert types(detector.observe(hotel(170), *DATES)) == [PRICE_DROP, NEW_LOW]
+    assert detector.observe(hotel(180), *DATES) == []
+
+
+def test_card_price_does_not_mix_with_rooms():
+    detector = PriceChangeDetector()
+    detector.observe(hotel(200, rooms=[('Double', 210)]), *DATES)
+
+    # Detail page failed: only the card price is known
+    assert detector.observe(hotel(200, rooms=[]), *DATES) == []
+    # Rooms are back: no bogus sold-out or new-room events
+    assert detector.observe(hotel(200, rooms=[('Double', 210)]), *DATES) == []
+
+    events = detector.observe(hotel(200, rooms=[('Double', 210), ('Suite', 400)]), *DATES)
+    assert types(events) == [NEW_ROOM]
+    events = detector.observe(hotel(200, rooms=[('Suite', 400)]), *DATES)
+    assert [(e['type'], e['room_type']) for e in events] == [(SOLD_OUT, 'Double')]
+
+
+def test_fields_not_extracted_are_ignored():
+    detector = PriceChangeDetector()
+    detector.observe(hotel(200, rooms=[('Double', 210)]), *DATES)
+    assert detector.observe({'hotel_name': 'Test Hotel', 'detail_url': URL}, *DATES) == []
+
+
+def test_new_low_ignores_currency_change():
+    detector = PriceChangeDetector()
+    detector.observe(hotel(100, currency='USD'), *DATES)
+    assert detector.observe(hotel(90, currency='EUR'), *DATES) == []
+    assert types(detector.observe(hotel(80, currency='EUR'), *DATES)) == [PRICE_DROP, NEW_LOW]
@@ -0,0 +1,64 @@
+import json
+import os
+import subprocess
+import sys
+
+import src.__main__ as cli
+import src.config.settings as settings
+
+SCRAPER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ('selenium', 'bs4', 'numpy')
+
+RESULTS = {
+    'city': 'New York',
+    'hotels': [
+        {'hotel_name': 'Test Hotel', 'price_amount': 250.0, 'price_currency': 'USD',
+         'review_scores': {'rating': 8.6, 'count': 120}},
+    ],
+}
+
+
+def test_query_does_not_import_heavy_modules(tmp_path):
+    results = tmp_path / 'results.json'
+    results.write_text(json.dumps(RESULTS), encoding='utf-8')
+
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'src', 'query', str(results)],
+        cwd=SCRAPER_DIR, capture_output=True, text=True, check=True
+    )
+    assert 'Test Hotel' in proc.stdout
+    # importtime lines end with "|   <indent><module name>"
+    imported = {line.rsplit('|', 1)[1].strip() for line in proc.stderr.splitlines()
+                if line.startswith('import time:')}
+    loaded = {name for name in imported if name.split('.')[0] in HEAVY_MODULES}
+    assert not loaded
+
+
+def test_batch_shares_state_and_saves_once(tmp_path, monkeypatch):
+    vocab_file = tmp_path / 'vocab.json'
+    state_file = tmp_path / 'state.json'
+    monkeypatch.setattr(settings, 'AMENITY_VOCAB_FILE', str(vocab_file))
+    monkeypatch.setattr(settings, 'PRICE_STATE_FILE', str(state_file))
+
+    cities = [f'City {i}' for i in range(8)]
+    jobs = tmp_path / 'jobs.json'
+    jobs.write_text(json.dumps([
+        {'city': city, 'check_in': '2025-01-10', 'check_out': '2025-01-14'} for city in cities
+    ]), encoding='utf-8')
+
+    def fake_run_job(city, check_in, check_out, shared=None, **kwargs):
+        vocab, detector, lock = shared
+        hotel = {'hotel_name': city, 'price_amount': 100.0, 'price_currency': 'USD',
+                 'detail_url': f'https://www.kayak.com/hotels/x-h{cities.index(city)}-details'}
+        with lock:
+            vocab.normalize([f'{city} amenity'])
+            detector.observe(hotel, check_in, check_out)
+        return {'hotels': [hotel]}
+
+    monkeypatch.setattr(cli, 'run_job', fake_run_job)
+    assert cli.main(['batch', str(jobs), '--workers', '4', '--track']) == 0
+
+    vocab = json.loads(vocab_file.read_text(encoding='utf-8'))
+    state = json.loads(state_file.read_text(encoding='utf-8'))
+    assert {f'city_{i}_amenity' for i in range(8)} <= set(vocab['names'])
+    assert len(state['rooms']) == 8
@@ -0,0 +1,75 @@
+import asyncio
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.utils.images import ImageCollector, canonical_asset_id, fetch_images, parse_srcset
+
+CDN = 'https://content.r9cdn.net'
+
+
+def test_resized_and_original_urls_share_an_asset_id():
+    resized = f"{CDN}/rimg/himg/9c/3a/x.jpg?width=500&height=350&crop=true"
+    original = f"{CDN}/himg/9c/3a/x.jpg"
+
+    assert canonical_asset_id(resized) == canonical_asset_id(original) == 'himg/9c/3a/x.jpg'
+
+
+def test_collector_keeps_widest_variant_per_asset():
+    collector = ImageCollector()
+    collector.add(f"{CDN}/himg/9c/3a/x.jpg", alt='Lobby', type='detail')
+    added = collector.add_srcset(
+        f"{CDN}/rimg/himg/9c/3a/x.jpg?width=300 300w, {CDN}/rimg/himg/9c/3a/x.jpg?width=900 900w"
+    )
+
+    images = collector.images()
+    assert added == 0
+    assert len(images) == 1
+    assert images[0]['width'] == 900
+    assert images[0]['alt'] == 'Lobby'
+
+
+def test_parse_srcset_reads_widths():
+    assert parse_srcset('a.jpg 300w, b.jpg 2x, c.jpg') == [('a.jpg', 300), ('b.jpg', None), ('c.jpg', None)]
+
+
+@pytest.fixture
+def image_server():
+    bodies = {'/a.jpg': b'same-bytes', '/b.jpg': b'same-bytes', '/c.png': b'other-bytes'}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = bodies.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_fetch_images_stores_content_addressed_files(image_server, tmp_path):
+    pytest.importorskip('aiohttp')
+    images = [{'url': f"{image_server}/{name}"} for name in ('a.jpg', 'b.jpg', 'c.png', 'missing.jpg')]
+
+    digests = asyncio.run(fetch_images(images, str(tmp_path)))
+
+    same = hashlib.sha256(b'same-bytes').hexdigest()
+    assert digests == {same, hashlib.sha256(b'other-bytes').hexdigest()}
+    assert images[0]['sha256'] == images[1]['sha256'] == same
+    assert 'sha256' not in images[3]
+    stored = [f for _, _, files in os.walk(tmp_path) for f in files]
+    assert sorted(stored) == sorted([f"{same}.jpg", f"{hashlib.sha256(b'other-bytes').hexdigest()}.png"])
@@ -0,0 +1,190 @@
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('selenium')
+
+from selenium.common.exceptions import NoSuchElementException
+
+import src.scrapers.kayak as kayak
+from src.utils.amenities import AmenityVocabulary
+from src.utils.selectors import (
+    HOTEL_LOCATION, HOTEL_NAME, HOTEL_RATING, HOTEL_REVIEWS, PRICE_AMOUNT,
+)
+
+DETAIL_URL = 'https://www.kayak.com/hotels/Test-Hotel,New-York-p1-h2503300-details'
+
+
+class FakeElement:
+    def __init__(self, text='', href=None, children=None):
+        self.text = text
+        self.href = href
+        self.children = children or {}
+
+    def get_attribute(self, name):
+        return self.href if name == 'href' else None
+
+    def find_element(self, by, selector):
+        if selector not in self.children:
+            raise NoSuchElementException(selector)
+        return self.children[selector]
+
+
+def hotel_card():
+    return FakeElement(children={
+        HOTEL_NAME: FakeElement('Test Hotel', href=DETAIL_URL),
+        HOTEL_LOCATION: FakeElement('Midtown'),
+        HOTEL_RATING: FakeElement('8.6'),
+        HOTEL_REVIEWS: FakeElement('Excellent (1,204 reviews)'),
+        PRICE_AMOUNT: FakeElement('$250'),
+    })
+
+
+class FakeDriver:
+    def __init__(self, cookies=None, current_url='about:blank'):
+        self.visited = []
+        self.cookies = list(cookies or [])
+        self.current_url = current_url
+        self.window_handles = ['main']
+        self.page_source = '<html></html>'
+        self.quit_called = False
+
+    def get(self, url):
+        self.visited.append(url)
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        return 'complete'
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies]
+
+    def add_cookie(self, cookie):
+        self.cookies.append(cookie)
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeBroker:
+    """Hands out fake drivers in place of remote browser sessions"""
+
+    def __init__(self, failures=0):
+        self.drivers = []
+        self.failures = failures  # acquires after the first that fail
+
+    def acquire(self, timeout=60):
+        if self.drivers and self.failures:
+            self.failures -= 1
+            raise RuntimeError('node unavailable')
+        driver = FakeDriver()
+        self.drivers.append(driver)
+        return driver
+
+    def release(self, driver):
+        driver.quit()
+
+
+@pytest.fixture
+def make_scraper(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(kayak, 'ensure_data_dir', lambda: str(tmp_path))
+    monkeypatch.setattr(kayak, 'wait_for_page_load', lambda driver: True)
+    monkeypatch.setattr(kayak, 'wait_for_elements', lambda driver, selector: [hotel_card()])
+    monkeypatch.setattr(kayak.time, 'sleep', lambda seconds: None)
+
+    def make(fields=None, broker=None):
+        scraper = kayak.KayakHotelScraper(
+            'New York', datetime(2025, 1, 10), datetime(2025, 1, 14), fields=fields,
+            broker=broker or FakeBroker(), amenity_vocab=AmenityVocabulary()
+        )
+        scraper.handle_popups = lambda: None
+        scraper.calls = []
+
+        def stage(name, result):
+            def run(*args, **kwargs):
+                scraper.calls.append(name)
+                return result
+            return run
+
+        scraper.extract_detail_page_images = stage('images', [])
+        scraper.extract_room_details = stage('rooms', [{'room_type': 'Double', 'price': 260.0,
+                                                        'currency': 'USD'}])
+        scraper.extract_amenities = stage('amenities', ['Free WiFi'])
+        return scraper
+
+    return make
+
+
+def test_price_profile_stays_on_search_page(make_scraper):
+    scraper = make_scraper(fields={'price'})
+    results = scraper.scrape_hotels()
+
+    assert scraper.driver.visited == [scraper.construct_search_url()]
+    assert scraper.calls == []
+    hotel = results['hotels'][0]
+    assert hotel['price_amount'] == 250.0
+    assert 'location' not in hotel and 'review_scores' not in hotel
+
+
+def test_price_and_rooms_profile_skips_other_detail_stages(make_scraper):
+    scraper = make_scraper(fields={'price', 'rooms'})
+    results = scraper.scrape_hotels()
+
+    search_url = scraper.construct_search_url()
+    assert scraper.driver.visited == [search_url, DETAIL_URL, search_url]
+    assert scraper.calls == ['rooms']
+    assert results['hotels'][0]['rooms'][0]['room_type'] == 'Double'
+
+    timing = results['metadata']['timing']
+    assert timing['fields'] == ['price', 'rooms']
+    assert timing['hotels'] == 1
+    assert timing['total_seconds'] >= 0
+
+
+def test_full_profile_runs_every_stage(make_scraper):
+    scraper = make_scraper()
+    results = scraper.scrape_hotels()
+
+    assert scraper.calls == ['images', 'rooms', 'amenities']
+    assert results['hotels'][0]['amenity_keys'] == ['wifi']
+
+
+def test_recycle_restores_cookies_and_page(make_scraper):
+    scraper = make_scraper()
+    old = scraper.driver
+    old.current_url = DETAIL_URL
+    old.cookies = [{'name': 'session', 'value': 'abc', 'domain': '.kayak.com', 'sameSite': 'Lax'}]
+    for _ in range(5):
+        scraper.monitor.page_loaded()
+
+    scraper.recycle_driver()
+
+    assert old.quit_called
+    new = scraper.driver
+    assert new is not old
+    assert new.visited == [scraper.base_url, DETAIL_URL]
+    assert new.cookies == [{'name': 'session', 'value': 'abc', 'domain': '.kayak.com'}]
+    assert scraper.monitor.recycles == 1
+    # The page reloaded after recycling counts towards the new driver
+    assert scraper.monitor.pages == 1
+
+
+def test_recycle_retries_a_failed_driver_start(make_scraper):
+    broker = FakeBroker(failures=2)
+    scraper = make_scraper(broker=broker)
+    scraper.recycle_driver(max_retries=3)
+    assert scraper.driver is broker.drivers[-1]
+    assert len(broker.drivers) == 2
+
+
+def test_failed_recycle_stops_the_scrape(make_scraper):
+    broker = FakeBroker(failures=10)
+    scraper = make_scraper(broker=broker)
+    scraper.monitor.max_pages = 1
+    results = scraper.scrape_hotels()
+
+    assert scraper.driver is None
+    assert broker.drivers[0].quit_called
+    assert results['hotels'] == []
+    scraper.close()
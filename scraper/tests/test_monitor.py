@@ -0,0 +1,64 @@
+import os
+import signal
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from src.core.monitor import ResourceMonitor, process_tree
+
+# Forks from a worker thread, the way chromedriver starts Chromium
+HELPER = textwrap.dedent('''
+    import subprocess, sys, threading
+
+    def spawn():
+        child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)'])
+        print(child.pid, flush=True)
+        child.wait()
+
+    thread = threading.Thread(target=spawn)
+    thread.start()
+    sys.stdin.read()
+    thread.join()
+''')
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='reads /proc')
+def test_process_tree_includes_children_forked_from_threads():
+    helper = subprocess.Popen([sys.executable, '-c', HELPER], stdin=subprocess.PIPE,
+                              stdout=subprocess.PIPE, text=True)
+    child_pid = None
+    try:
+        child_pid = int(helper.stdout.readline())
+        assert child_pid in process_tree(helper.pid)
+    finally:
+        if child_pid:
+            os.kill(child_pid, signal.SIGTERM)
+        helper.stdin.close()
+        helper.wait(timeout=10)
+
+
+def sample(rss_mb=None):
+    return {'rss_mb': rss_mb}
+
+
+def test_should_recycle_on_page_limit():
+    monitor = ResourceMonitor(max_rss_mb=1000, max_pages=3)
+    for _ in range(2):
+        monitor.page_loaded()
+    assert monitor.should_recycle(sample()) is None
+    monitor.page_loaded()
+    assert monitor.should_recycle(sample()) == '3 pages loaded'
+
+    monitor.recycled()
+    assert monitor.pages == 0 and monitor.total_pages == 3 and monitor.recycles == 1
+    assert monitor.should_recycle(sample()) is None
+
+
+def test_should_recycle_on_rss_limit():
+    monitor = ResourceMonitor(max_rss_mb=1000, max_pages=None)
+    assert monitor.should_recycle(sample(999.9)) is None
+    assert monitor.should_recycle(sample(1200)) == 'browser RSS 1200 MB'
+    # Unknown RSS (no /proc or no local browser process) never triggers
+    assert monitor.should_recycle(sample(None)) is None
@@ -0,0 +1,81 @@
+import json
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip('bs4')
+pytest.importorskip('lxml')
+
+from src.core.archive import SnapshotArchive
+import src.scrapers.offline as offline
+from src.scrapers.offline import parse_search_page, reextract_archive
+from src.utils.amenities import AmenityVocabulary
+
+SEARCH_URL = 'https://www.kayak.com/hotels/New-York,NY-c15830/2025-01-10/2025-01-14/2adults'
+DETAIL_PATH = '/hotels/Test-Hotel,New-York-p1-h2503300-details/2025-01-10/2025-01-14/2adults'
+CONTEXT = {'city': 'New York', 'check_in': '2025-01-10', 'check_out': '2025-01-14'}
+
+SEARCH_HTML = f'''
+<html><body>
+<div class="S0Ps-resultInner">
+  <a class="FLpo-big-name" href="{DETAIL_PATH}">Test Hotel</a>
+  <div class="upS4-big-name">Midtown</div>
+  <div class="c1XBO">$250</div>
+</div>
+</body></html>
+'''
+
+DETAIL_HTML = '''
+<html><body>
+<div class="LK1E-groupedRoomType">
+  <div class="c_Hjx-group-header-title">Double Room</div>
+  <span class="C9NJ-amount">$260</span>
+</div>
+<div class="tYfO-amenity-name">Free WiFi</div>
+<div class="tYfO-amenity-name">Pool</div>
+</body></html>
+'''
+
+
+def test_search_links_are_resolved():
+    hotels = parse_search_page(SEARCH_HTML, SEARCH_URL)
+    assert hotels[0]['detail_url'] == f'https://www.kayak.com{DETAIL_PATH}'
+
+
+def record(tmp_path):
+    archive = SnapshotArchive(str(tmp_path))
+    archive.save(SEARCH_URL, SEARCH_HTML, 'search', CONTEXT, datetime(2025, 1, 1, 12, 0))
+    archive.save(f'https://www.kayak.com{DETAIL_PATH}', DETAIL_HTML, 'detail', CONTEXT,
+                 datetime(2025, 1, 1, 12, 1))
+    return archive
+
+
+def test_reextract_joins_search_and_detail_snapshots(tmp_path):
+    results = reextract_archive(record(tmp_path), workers=1)
+    assert len(results) == 1
+    hotel = results[0]['hotels'][0]
+    assert hotel['price_amount'] == 250.0
+    assert [room['room_type'] for room in hotel['rooms']] == ['Double Room']
+    assert hotel['rooms'][0]['price'] == 260.0
+    assert hotel['amenity_keys'] == ['wifi', 'pool']
+
+
+def test_reextract_does_not_count_amenities_again(tmp_path):
+    vocab = AmenityVocabulary()
+    vocab.normalize(['Free WiFi', 'Pool'])
+    counts = dict(vocab.counts)
+
+    results = reextract_archive(record(tmp_path), workers=1, vocab=vocab)
+    assert results[0]['hotels'][0]['amenity_keys'] == ['wifi', 'pool']
+    assert vocab.counts == counts
+
+
+def test_main_creates_the_output_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(offline, 'AMENITY_VOCAB_FILE', str(tmp_path / 'vocab.json'))
+    record(tmp_path / 'archive')
+    output = tmp_path / 'missing' / 'reextracted.json'
+
+    offline.main(['--archive', str(tmp_path / 'archive'), '--output', str(output),
+                  '--workers', '1'])
+    results = json.loads(output.read_text(encoding='utf-8'))
+    assert results[0]['hotels'][0]['hotel_name'] == 'Test Hotel'
@@ -0,0 +1,43 @@
+import pytest
+
+from src.utils.prices import PER_NIGHT, TAXES_INCLUDED, benchmark, parse_price, parse_prices
+
+
+@pytest.mark.parametrize('text, amount, currency', [
+    ('$1,234.56', 1234.56, 'USD'),
+    ('1.234,56 €', 1234.56, 'EUR'),
+    ('€12,50', 12.5, 'EUR'),
+    ('JPY 12,000', 12000.0, 'JPY'),
+    ('C$200 incl. taxes', 200.0, 'CAD'),
+    ('2 nights $300', 300.0, 'USD'),
+    ('$300 for 2 nights', 300.0, 'USD'),
+    ('4 guests, 2 rooms: 1 234 EUR', 1234.0, 'EUR'),
+])
+def test_parse_price_amount_and_currency(text, amount, currency):
+    parsed = parse_price(text)
+    assert parsed['amount'] == amount
+    assert parsed['currency'] == currency
+
+
+def test_parse_price_labels():
+    assert parse_price('US$95 per night')['per_night']
+    assert parse_price('$300 for 2 nights')['total']
+    assert parse_price('$88 + taxes and fees')['taxes_included'] is False
+    assert parse_price('') is None
+    assert parse_price('Sold out') is None
+
+
+def test_parse_prices_returns_arrays():
+    np = pytest.importorskip('numpy')
+    result = parse_prices(['$40 per night', None, '€1.200,50 incl. taxes', '$40 per night'])
+
+    assert np.allclose(result['amount'], [40.0, np.nan, 1200.5, 40.0], equal_nan=True)
+    assert list(result['currency']) == ['USD', '', 'EUR', 'USD']
+    assert list(result['flags']) == [PER_NIGHT, 0, TAXES_INCLUDED, PER_NIGHT]
+
+
+def test_benchmark_reports_all_distinct_case():
+    pytest.importorskip('numpy')
+    result = benchmark(n=2000, distinct=None)
+    assert result['distinct'] > 1900
+    assert result['parsed'] == 2000
@@ -0,0 +1,123 @@
+import json
+import os
+
+import pytest
+
+from analyze_project import CACHE_FILE, ProjectAnalyzer
+
+
+def write(root, rel_path, data):
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, bytes):
+        path.write_bytes(data)
+    else:
+        path.write_text(data, encoding='utf-8')
+    return path
+
+
+def read_output(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / 'project'
+    write(root, 'b.py', 'print("b")\n')
+    write(root, 'a/z.txt', 'z\n')
+    write(root, 'a/m/deep.py', 'x = 1\n')
+    write(root, 'c.txt', 'c\n')
+    write(root, 'image.png', b'\x89PNG\r\n\x1a\n\0\0\0')
+    write(root, '__pycache__/b.cpython-311.pyc', b'\0')
+    write(root, '.git/HEAD', 'ref: refs/heads/main\n')
+    write(root, 'notes.md', '# notes\n')
+    write(root, 'debug.log', 'log\n')
+    return root
+
+
+def test_walk_is_sorted_and_skips_ignored_entries(tree):
+    # Each directory's files come before its subdirectories, both by name
+    paths = [path for path, _ in ProjectAnalyzer(str(tree)).iter_files()]
+    assert paths == ['b.py', 'c.txt', 'image.png', os.path.join('a', 'z.txt'),
+                     os.path.join('a', 'm', 'deep.py')]
+
+
+@pytest.mark.parametrize('sample, binary', [
+    (b'plain text\n', False),
+    ('café €'.encode('utf-8'), False),
+    # A multi-byte character cut off by the sniff window is still text
+    ('abc€'.encode('utf-8')[:-1], False),
+    (b'has\0nul', True),
+    (b'\xff\xfe' + b'x' * 20, True),
+])
+def test_is_binary(sample, binary):
+    assert ProjectAnalyzer.is_binary(sample) is binary
+
+
+def test_large_and_binary_files_are_hashed_without_content(tree):
+    write(tree, 'big.txt', 'x' * 100)
+    analyzer = ProjectAnalyzer(str(tree), max_file_size=50, cache_file=None)
+    records = {record['path']: record for record in analyzer.analyze()}
+    assert records['big.txt']['skipped'] == 'too_large' and records['big.txt']['content'] is None
+    assert records['image.png']['skipped'] == 'binary'
+    assert records['b.py']['content'] == 'print("b")\n'
+    assert all(len(record['sha256']) == 64 for record in records.values())
+
+
+def test_statuses_across_two_runs(tree, tmp_path, monkeypatch):
+    output = str(tmp_path / 'structure.jsonl')
+    first = ProjectAnalyzer(str(tree), workers=2).save_analysis(output)
+    assert first == {'new': 5}
+
+    write(tree, 'b.py', 'print("changed")\n')
+    os.remove(tree / 'c.txt')
+    write(tree, 'a/new.txt', 'new\n')
+    touched = tree / 'a' / 'z.txt'
+    os.utime(touched, ns=(touched.stat().st_atime_ns, touched.stat().st_mtime_ns + 10**9))
+
+    analyzer = ProjectAnalyzer(str(tree), workers=2)
+    reads = []
+    read_file = analyzer.read_file
+    monkeypatch.setattr(analyzer, 'read_file',
+                        lambda rel_path, stat: reads.append(rel_path) or read_file(rel_path, stat))
+    second = analyzer.save_analysis(output)
+
+    assert second == {'new': 1, 'modified': 1, 'unchanged': 3, 'deleted': 1}
+    # Untouched files are replayed from the previous output, not read
+    assert sorted(reads) == sorted([os.path.join('a', 'new.txt'), os.path.join('a', 'z.txt'),
+                                    'b.py'])
+
+    lines = read_output(output)
+    assert lines[0]['type'] == 'root'
+    records = {record['path']: record for record in lines[1:]}
+    assert 'c.txt' not in records
+    assert records['b.py']['status'] == 'modified'
+    assert records['b.py']['content'] == 'print("changed")\n'
+    assert records[os.path.join('a', 'new.txt')]['status'] == 'new'
+    # Touched but identical, and untouched: both unchanged with full content
+    assert records[os.path.join('a', 'z.txt')]['status'] == 'unchanged'
+    assert records[os.path.join('a', 'm', 'deep.py')] == dict(
+        records[os.path.join('a', 'm', 'deep.py')], status='unchanged', content='x = 1\n')
+    assert records['image.png']['skipped'] == 'binary'
+
+
+def test_cache_keeps_only_file_metadata(tree, tmp_path):
+    ProjectAnalyzer(str(tree)).save_analysis(str(tmp_path / 'structure.jsonl'))
+    with open(tree / CACHE_FILE, 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    assert set(cache) == {'b.py', 'c.txt', 'image.png', os.path.join('a', 'z.txt'),
+                          os.path.join('a', 'm', 'deep.py')}
+    assert all(set(entry) == {'size', 'mtime_ns', 'sha256'} for entry in cache.values())
+
+
+def test_missing_previous_output_falls_back_to_reading(tree, tmp_path):
+    output = tmp_path / 'structure.jsonl'
+    ProjectAnalyzer(str(tree)).save_analysis(str(output))
+    output.unlink()
+
+    counts = ProjectAnalyzer(str(tree)).save_analysis(str(output))
+    assert counts == {'unchanged': 5}
+    records = read_output(output)[1:]
+    assert all('sha256' in record for record in records)
+    assert next(r for r in records if r['path'] == 'b.py')['content'] == 'print("b")\n'